@@ -36,13 +36,15 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Tuple, Any
+import sys
+from typing import List, Dict, Tuple, Any, Iterable, Optional
+from xml.etree.ElementTree import Element
 
 from qtpy.QtCore import QPointF, QLineF, QSizeF, QXmlStreamReader, QXmlStreamWriter
 from qtpy.QtCore import Qt
 
 from .globals import Globals
-from .socket import Socket
+from .socket import Socket, parse_socket_from_element
 
 
 class Block:
@@ -57,6 +59,15 @@ class Block:
         m_connection_helper_block: 是否为辅助连接的虚拟块。
     """
 
+    __slots__ = (
+        "m_name",
+        "m_pos",
+        "m_size",
+        "m_sockets",
+        "m_properties",
+        "m_connection_helper_block",
+    )
+
     def __init__(self, name: str = "", x: float = 0.0, y: float = 0.0) -> None:
         """初始化对象。
 
@@ -66,7 +77,7 @@ class Block:
             y: 块的 Y 坐标。
         """
 
-        self.m_name: str = name
+        self.m_name: str = sys.intern(name)
         self.m_pos: QPointF = QPointF(x, y)
         self.m_size: QSizeF = QSizeF(100, 50)
         self.m_sockets: List[Socket] = []
@@ -86,7 +97,7 @@ class Block:
             raise RuntimeError("需要起始元素。")
 
         # 读取 Block 元素的属性
-        self.m_name = reader.attributes().value("name")
+        self.m_name = sys.intern(str(reader.attributes().value("name")))
 
         while not reader.atEnd() and not reader.hasError():
             reader.readNext()
@@ -122,6 +133,43 @@ class Block:
                 if ename == "Block":
                     break
 
+    def read_xml_element(
+        self,
+        elem: Element,
+        pending_positions: Optional[List[Tuple[Socket, str]]] = None,
+    ) -> None:
+        """从已解析的 XML 元素读取块数据。
+
+        Args:
+            elem: Block 元素。
+            pending_positions: 插槽位置的延迟解码列表，参见 Socket.read_xml_element。
+
+        Raises:
+            RuntimeError: 包含未知元素时触发。
+        """
+        self.m_name = sys.intern(elem.get("name", ""))
+
+        for child in elem:
+            ename = child.tag
+            if ename == "Position":
+                self.m_pos = self._decode_point(child.text or "")
+            elif ename == "Size":
+                pos = self._decode_point(child.text or "")
+                self.m_size.setWidth(pos.x())
+                self.m_size.setHeight(pos.y())
+            elif ename == "Sockets":
+                self.m_sockets.extend(
+                    parse_socket_from_element(socket_elem, pending_positions)
+                    for socket_elem in child
+                    if socket_elem.tag == "Socket"
+                )
+            elif ename == "Properties":
+                for prop in child:
+                    if prop.tag == "ShowPixmap":
+                        self.m_properties["ShowPixmap"] = prop.text == "true"
+            else:
+                raise RuntimeError(f"在块标签中发现未知元素：'{ename}'。")
+
     def write_xml(self, writer: QXmlStreamWriter) -> None:
         """将块数据写入 XML。
 
@@ -282,7 +330,7 @@ class Block:
                 continue
 
             new_socket = Socket()
-            new_socket.m_name = s
+            new_socket.m_name = sys.intern(s)
             new_socket.m_inlet = s in inlet_sockets
 
             found = False
@@ -329,6 +377,14 @@ class Block:
 
             self.m_sockets.append(new_socket)
 
+    def set_sockets(self, sockets: Iterable[Socket]) -> None:
+        """一次性替换块的全部插槽。
+
+        Args:
+            sockets: 新的插槽序列。
+        """
+        self.m_sockets = list(sockets)
+
     def filter_sockets(self, inlet_socket: bool) -> List[Socket]:
         """筛选入口或出口插槽列表。
 
@@ -370,8 +426,8 @@ class Block:
         Returns:
             解码后的点坐标对象。
         """
-        x, y = map(float, pos.split(","))
-        return QPointF(x, y)
+        i = pos.index(",")
+        return QPointF(float(pos[:i]), float(pos[i + 1 :]))
 
     @staticmethod
     def _encode_point(point: QPointF) -> str:
@@ -383,7 +439,7 @@ class Block:
         Returns:
             编码后的点坐标字符串（格式："x,y"）。
         """
-        return f"{point.x()},{point.y()}"
+        return str(point.x()) + "," + str(point.y())
 
     @staticmethod
     def _read_list(reader: QXmlStreamReader, sockets: List[Socket]) -> None:
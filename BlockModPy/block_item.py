@@ -36,7 +36,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .socket_item import SocketItem
@@ -61,7 +61,7 @@ from qtpy.QtWidgets import (
 )
 
 from .block import Block
-from .globals import Globals
+from .globals import Globals, scene_manager_class
 
 
 class BlockItem(QGraphicsRectItem):
@@ -81,7 +81,11 @@ class BlockItem(QGraphicsRectItem):
         super().__init__(parent)
         self.m_block: Block = block
         self.m_socket_items: List[SocketItem] = []
+        # 入口插槽在块局部坐标系中的位置表：(x, y, 插槽项)
+        self.m_inlet_socket_table: List[Tuple[float, float, SocketItem]] = []
         self.m_moved: bool = False
+        # 缓存的边界矩形，矩形变化时（setRect）失效
+        self.m_bounding_rect: Optional[QRectF] = None
 
         self.setFlags(
             QGraphicsRectItem.ItemIsMovable
@@ -110,15 +114,21 @@ class BlockItem(QGraphicsRectItem):
             scene_pos: 场景坐标。
 
         Returns:
-            如果找到接受连接的插槽项，返回该插槽项，否则返回 None。
+            命中半径内距离最近的入口插槽项；如果没有，返回 None。
         """
-        for socket_item in self.m_socket_items:
-            socket_scene_pos = socket_item.mapToScene(socket_item.socket.m_pos)
-            socket_scene_pos -= scene_pos
-            distance = socket_scene_pos.manhattanLength()
-            if distance < Globals.GridSpacing / 2:
-                return socket_item
-        return None
+        # 插槽项位于块的原点，只需将场景坐标换算到块局部坐标后查表
+        pos = self.pos()
+        px = scene_pos.x() - pos.x()
+        py = scene_pos.y() - pos.y()
+
+        closest_item: Optional[SocketItem] = None
+        closest_distance = Globals.GridSpacing / 2
+        for x, y, socket_item in self.m_inlet_socket_table:
+            distance = abs(x - px) + abs(y - py)
+            if distance < closest_distance:
+                closest_item = socket_item
+                closest_distance = distance
+        return closest_item
 
     def is_invisible(self) -> bool:
         """检查块是否为不可见块。
@@ -139,28 +149,47 @@ class BlockItem(QGraphicsRectItem):
         self.setRect(0, 0, new_width, new_height)
 
         for socket in self.m_block.m_sockets:
+            # 整体赋值而非原地修改，使插槽缓存的方向失效
             if socket.m_orientation == Qt.Horizontal:
                 if socket.m_pos.x() != 0.0:
-                    socket.m_pos.setX(new_width)
+                    socket.m_pos = QPointF(new_width, socket.m_pos.y())
             else:
                 if socket.m_pos.y() != 0.0:
-                    socket.m_pos.setY(new_height)
+                    socket.m_pos = QPointF(socket.m_pos.x(), new_height)
 
         for item in self.childItems():
             socket_item = item
             socket_item.update_socket_item()
             item.update()
+        self.update_inlet_socket_table()
         self.update()
 
+    def update_inlet_socket_table(self) -> None:
+        """根据当前插槽位置重建入口插槽位置表。"""
+        self.m_inlet_socket_table = [
+            (item.socket.m_pos.x(), item.socket.m_pos.y(), item)
+            for item in self.m_socket_items
+            if item.socket.m_inlet
+        ]
+
+    def setRect(self, *args) -> None:
+        """设置块的矩形，并使缓存的边界矩形失效。
+
+        Args:
+            *args: 与 QGraphicsRectItem.setRect() 相同的参数。
+        """
+        self.m_bounding_rect = None
+        super().setRect(*args)
+
     def boundingRect(self) -> QRectF:
         """获取块的边界矩形。
 
         Returns:
-            块的边界矩形。
+            块的边界矩形（缓存结果）。
         """
-        rect = super().boundingRect()
-
-        return rect
+        if self.m_bounding_rect is None:
+            self.m_bounding_rect = super().boundingRect()
+        return self.m_bounding_rect
 
     def create_socket_items(self) -> None:
         """创建插槽项。"""
@@ -173,6 +202,7 @@ class BlockItem(QGraphicsRectItem):
             if not socket.m_inlet:
                 socket_item.setZValue(20)
             self.m_socket_items.append(socket_item)
+        self.update_inlet_socket_table()
 
     def paint(
         self,
@@ -264,8 +294,7 @@ class BlockItem(QGraphicsRectItem):
             处理后的值。
         """
         if change == QGraphicsItem.ItemPositionChange:
-            from .scene_manager import SceneManager
-
+            SceneManager = scene_manager_class()
             scene_manager = self.scene()
 
             # 类型安全处理，确保 value 是 QPointF 类型
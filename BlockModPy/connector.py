@@ -36,18 +36,59 @@
 
 from __future__ import annotations
 
-from typing import List
+import sys
+from itertools import accumulate
+from typing import List, Optional, Tuple
+from weakref import WeakValueDictionary
+from xml.etree.ElementTree import Element
 
 from qtpy.QtCore import Qt, QXmlStreamReader, QXmlStreamWriter
 from qtpy.QtGui import QColor
 
 
+class RouteTemplate:
+    """不可变的连接器路由模板，保存线段的 (方向, 偏移量) 序列。
+
+    相同线段布局的连接器共享同一个模板对象（哈希共享），因此只需比较对象身份
+    即可判断两个连接器的路由是否一致，或某个连接器的路由自上次更新后是否变化。
+
+    Attributes:
+        m_segments: 线段的 (方向, 偏移量) 元组序列。
+        m_end_xs: 各线段终点相对于路由起点的 X 坐标。
+        m_end_ys: 各线段终点相对于路由起点的 Y 坐标。
+    """
+
+    __slots__ = ("m_segments", "m_end_xs", "m_end_ys", "__weakref__")
+
+    def __init__(self, segments: Tuple[Tuple[Qt.Orientation, float], ...]) -> None:
+        self.m_segments: Tuple[Tuple[Qt.Orientation, float], ...] = segments
+        # 按坐标轴分别保存增量并做前缀和，模板共享，因此每种布局只计算一次
+        self.m_end_xs: Tuple[float, ...] = tuple(
+            accumulate(
+                offset if direction == Qt.Horizontal else 0.0
+                for direction, offset in segments
+            )
+        )
+        self.m_end_ys: Tuple[float, ...] = tuple(
+            accumulate(
+                0.0 if direction == Qt.Horizontal else offset
+                for direction, offset in segments
+            )
+        )
+
+
+# 路由模板的共享表，模板在没有连接器引用时自动释放
+_route_templates: "WeakValueDictionary[tuple, RouteTemplate]" = WeakValueDictionary()
+
+
 class Connector:
     """Connector 类，表示网络中的连接器，负责管理连接器的源插槽、目标插槽和线段信息。"""
 
     class Segment:
         """Segment 类，表示连接器的一个线段，包含方向和偏移量信息。"""
 
+        __slots__ = ("m_direction", "m_offset")
+
         def __init__(
             self, direction: Qt.Orientation = Qt.Horizontal, offset: float = 0.0
         ) -> None:
@@ -100,6 +141,34 @@ class Connector:
                     if ename == "Segment":
                         break
 
+        def read_xml_element(self, elem: Element) -> None:
+            """从已解析的 XML 元素读取线段数据。
+
+            Args:
+                elem: Segment 元素。
+
+            Raises:
+                RuntimeError: 如果包含未知元素或数据无效。
+            """
+            for child in elem:
+                ename = child.tag
+                if ename == "Orientation":
+                    self.m_direction = (
+                        Qt.Horizontal if child.text == "Horizontal" else Qt.Vertical
+                    )
+                elif ename == "Offset":
+                    offset_str = child.text or ""
+                    try:
+                        self.m_offset = float(offset_str)
+                    except ValueError:
+                        raise RuntimeError(
+                            f"Invalid offset value '{offset_str}' in Segment element."
+                        )
+                else:
+                    raise RuntimeError(
+                        f"Found unknown element '{ename}' in Segment element."
+                    )
+
         def write_xml(self, writer: QXmlStreamWriter) -> None:
             """将线段数据写入 XML。
 
@@ -114,6 +183,17 @@ class Connector:
             writer.writeTextElement("Offset", f"{self.m_offset}")
             writer.writeEndElement()
 
+    __slots__ = (
+        "m_name",
+        "m_source_socket",
+        "m_target_socket",
+        "m_segments",
+        "m_text",
+        "m_linewidth",
+        "m_color",
+        "m_route_template",
+    )
+
     def __init__(self) -> None:
         """初始化 Connector 对象。"""
         self.m_name: str = ""
@@ -123,6 +203,34 @@ class Connector:
         self.m_text: str = ""
         self.m_linewidth: float = 0.8
         self.m_color: QColor = Qt.black
+        self.m_route_template: Optional[RouteTemplate] = None
+
+    def segment_pairs(self) -> List[Tuple[Qt.Orientation, float]]:
+        """获取所有线段的 (方向, 偏移量) 紧凑表示。
+
+        线段对象会被直接修改（例如拖动线段时修改偏移量），因此这里不做缓存，
+        而是在每次几何更新开始时一次性展开，避免在循环中反复访问线段属性。
+
+        Returns:
+            按线段顺序排列的 (方向, 偏移量) 列表。
+        """
+        return [(seg.m_direction, seg.m_offset) for seg in self.m_segments]
+
+    def route_template(self) -> RouteTemplate:
+        """获取当前线段布局对应的共享路由模板。
+
+        Returns:
+            与当前线段布局相等的唯一模板对象。
+        """
+        key = tuple(self.segment_pairs())
+        template = self.m_route_template
+        if template is None or template.m_segments != key:
+            template = _route_templates.get(key)
+            if template is None:
+                template = RouteTemplate(key)
+                _route_templates[key] = template
+            self.m_route_template = template
+        return template
 
     def read_xml(self, reader: QXmlStreamReader) -> None:
         """从 XML 读取连接器数据。
@@ -143,9 +251,9 @@ class Connector:
             if reader.isStartElement():
                 ename = reader.name()
                 if ename == "Source":
-                    self.m_source_socket = reader.readElementText()
+                    self.m_source_socket = sys.intern(reader.readElementText())
                 elif ename == "Target":
-                    self.m_target_socket = reader.readElementText()
+                    self.m_target_socket = sys.intern(reader.readElementText())
                 elif ename == "Segments":
                     self._read_segments(reader)
                 else:
@@ -158,6 +266,32 @@ class Connector:
                 if ename == "Connector":
                     break
 
+    def read_xml_element(self, elem: Element) -> None:
+        """从已解析的 XML 元素读取连接器数据。
+
+        Args:
+            elem: Connector 元素。
+
+        Raises:
+            RuntimeError: 如果包含未知元素或数据无效。
+        """
+        self.m_name = elem.get("name", "")
+
+        for child in elem:
+            ename = child.tag
+            if ename == "Source":
+                self.m_source_socket = sys.intern(child.text or "")
+            elif ename == "Target":
+                self.m_target_socket = sys.intern(child.text or "")
+            elif ename == "Segments":
+                for segment_elem in child:
+                    if segment_elem.tag == "Segment":
+                        segment = Connector.Segment()
+                        segment.read_xml_element(segment_elem)
+                        self.m_segments.append(segment)
+            else:
+                raise RuntimeError(f"Found unknown element '{ename}' in Connector tag.")
+
     def write_xml(self, writer: QXmlStreamWriter) -> None:
         """将连接器数据写入 XML。
 
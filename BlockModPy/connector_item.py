@@ -0,0 +1,218 @@
+#  BSD 3-Clause License
+#
+#  This file is part of the BlockModPy Library (Python port).
+#
+#  Original C++ implementation:
+#  	Copyright (c) 2019, Andreas Nicolai (BSD-3-Clause)
+#
+#  Python port:
+#  	Copyright (c) 2025, Sun Hao
+#
+#  Redistribution and use in source and binary forms, with or without modification,
+#  are permitted provided that the following conditions are met:
+#
+#  1. Redistributions of source code must retain the above copyright notice, this
+#     list of conditions and the following disclaimer.
+#
+#  2. Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#  3. Neither the name of the original copyright holder (Andreas Nicolai),
+#     the BlockMod Library, nor the names of its contributors may be used to endorse
+#     or promote products derived from this software without specific prior written
+#     permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+#  IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+#  INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+#  DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+#  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+#  OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from qtpy.QtCore import Qt, QLineF, QRectF
+from qtpy.QtGui import (
+    QPainter,
+    QPainterPath,
+    QColor,
+    QPen,
+    QBrush,
+    QFont,
+    QFontMetricsF,
+)
+from qtpy.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem, QWidget
+
+from .connector import Connector
+from .globals import scene_manager_class
+
+
+class ConnectorItem(QGraphicsItem):
+    """ConnectorItem 类，用一条路径一次性绘制整个连接器。
+
+    连接器的各线段仍由 ConnectorSegmentItem 负责命中测试和拖动，
+    但这些线段项本身不绘制任何内容（ItemHasNoContents），
+    因此每个连接器每次重绘只需一次 paint 调用。
+    """
+
+    def __init__(self, connector: Connector) -> None:
+        """初始化 ConnectorItem 对象。
+
+        Args:
+            connector: 关联的连接器对象。
+        """
+        super().__init__()
+        self.m_connector: Connector = connector
+        self.m_is_highlighted: bool = False
+        self.m_path: QPainterPath = QPainterPath()
+        # 路径上依次经过的点（场景坐标）：起始线段终点、各中间线段终点
+        self.m_points: List[Tuple[float, float]] = []
+        self.m_text_rect: QRectF = QRectF()
+        self.m_bounding_rect: QRectF = QRectF()
+        self.setZValue(5)  # Below block
+        # 鼠标交互全部交给线段项，自身不参与命中测试
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        # 连接器整体绘制结果按设备坐标缓存；几何、高亮和选中状态变化时均调用 update() 使缓存失效
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def set_geometry(
+        self,
+        start_line: QLineF,
+        end_points: List[Tuple[float, float]],
+        end_line: QLineF,
+    ) -> None:
+        """根据连接器的几何信息重建绘制路径。
+
+        Args:
+            start_line: 起始线段（源插槽处，场景坐标）。
+            end_points: 各中间线段终点（场景坐标）。
+            end_line: 结束线段（目标插槽处，场景坐标）。
+        """
+        path = QPainterPath()
+        path.moveTo(start_line.p1())
+        path.lineTo(start_line.p2())
+        for x, y in end_points:
+            path.lineTo(x, y)
+        path.moveTo(end_line.p1())
+        path.lineTo(end_line.p2())
+
+        self.prepareGeometryChange()
+        self.m_path = path
+        self.m_points = [(start_line.x2(), start_line.y2())] + end_points
+        self.m_text_rect = self._calculate_text_rect()
+
+        margin = 1.5 * self.m_connector.m_linewidth
+        rect = path.boundingRect().adjusted(-margin, -margin, margin, margin)
+        if not self.m_text_rect.isNull():
+            rect = rect.united(self.m_text_rect.adjusted(-1, -1, 1, 1))
+        self.m_bounding_rect = rect
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        """获取连接器路径的边界矩形。
+
+        Returns:
+            连接器路径（含文字标签）的边界矩形。
+        """
+        return self.m_bounding_rect
+
+    def shape(self) -> QPainterPath:
+        """获取用于命中测试的形状。
+
+        Returns:
+            空路径，命中测试由各线段项完成。
+        """
+        return QPainterPath()
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """绘制连接器的全部线段及文字标签。
+
+        Args:
+            painter: 绘制器对象。
+            option: 样式选项。
+            widget: 绘制目标部件，默认为 None。
+        """
+        if self.m_path.isEmpty():
+            return
+
+        scene_manager = self.scene()
+        selected = (
+            isinstance(scene_manager, scene_manager_class())
+            and self.m_connector in scene_manager.m_selected_connectors
+        )
+
+        painter.save()
+        pen = QPen()
+        pen.setStyle(Qt.SolidLine)
+        if self.m_is_highlighted:
+            pen.setWidthF(1.5 * self.m_connector.m_linewidth)
+            pen.setColor(QColor(0, 0, 110))
+        else:
+            pen.setWidthF(self.m_connector.m_linewidth)
+            pen.setColor(self.m_connector.m_color)
+        if selected:
+            pen.setWidthF(1.5 * self.m_connector.m_linewidth)
+            pen.setColor(QColor(192, 0, 0))
+            pen.setStyle(Qt.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self.m_path)
+
+        # 在中心线段上绘制文字标签
+        if not self.m_text_rect.isNull():
+            pen = QPen()
+            pen.setWidthF(1)
+            pen.setColor(self.m_connector.m_color)
+            pen.setStyle(Qt.SolidLine)
+            painter.setPen(pen)
+            painter.setBrush(QBrush(Qt.white))
+            painter.drawRect(self.m_text_rect)
+            painter.drawText(self.m_text_rect, Qt.AlignCenter, self.m_connector.m_text)
+
+        painter.restore()
+
+    def _calculate_text_rect(self) -> QRectF:
+        """计算中心线段上文字标签的矩形。
+
+        Returns:
+            文字标签矩形；连接器没有文字或线段不足时返回空矩形。
+        """
+        if not self.m_connector.m_text:
+            return QRectF()
+
+        idx = self._calculate_central_segment_index()
+        if idx + 1 >= len(self.m_points):
+            return QRectF()
+
+        x1, y1 = self.m_points[idx]
+        x2, y2 = self.m_points[idx + 1]
+        x = (x1 + x2) / 2
+        y = (y1 + y2) / 2
+        br = QFontMetricsF(QFont()).boundingRect(
+            QRectF(int(x), int(y), 150, 30), 0, self.m_connector.m_text
+        )
+        width = 1.2 * br.width()
+        height = 1.2 * br.height()
+        return QRectF(x - width / 2, y - height / 2, width, height)
+
+    def _calculate_central_segment_index(self) -> int:
+        """计算中心线段的索引。
+
+        Returns:
+            中心线段的索引。
+        """
+        if len(self.m_connector.m_segments) <= 2:
+            return 0
+        return (len(self.m_connector.m_segments) - 2) // 2 + 1
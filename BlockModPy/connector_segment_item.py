@@ -39,26 +39,24 @@ from __future__ import annotations
 from typing import Optional, Any, TYPE_CHECKING
 
 from qtpy.QtCore import Qt, QPoint, QLineF, QRectF
-from qtpy.QtGui import QPainter, QPainterPath, QColor, QPen, QBrush
+from qtpy.QtGui import QPainterPath
 from qtpy.QtWidgets import (
     QGraphicsLineItem,
     QGraphicsSceneMouseEvent,
     QGraphicsSceneHoverEvent,
-    QStyleOptionGraphicsItem,
-    QWidget,
     QGraphicsItem,
     QApplication,
 )
 
 from .connector import Connector
-from .globals import Globals
+from .globals import Globals, scene_manager_class
 
 if TYPE_CHECKING:
     from .scene_manager import SceneManager
 
 
 class ConnectorSegmentItem(QGraphicsLineItem):
-    """表示连接器的一个线段项，负责绘制线段并处理相关事件。"""
+    """表示连接器的一个线段项，负责线段的命中测试、拖动及相关事件（绘制由 ConnectorItem 完成）。"""
 
     def __init__(self, connector: Connector) -> None:
         """初始化 ConnectorSegmentItem 对象。
@@ -72,6 +70,8 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         self.m_is_highlighted: bool = False
         self.m_moved: bool = False
         self.m_last_pos: QPoint = QPoint()
+        # 缓存的形状路径，线段变化时（setLine）失效
+        self.m_shape: Optional[QPainterPath] = None
 
         self.setFlags(
             QGraphicsLineItem.ItemIsMovable
@@ -80,79 +80,29 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         )
         self.setAcceptHoverEvents(True)
         self.setZValue(5)  # Below block
+        # 线段只负责命中测试和拖动，整个连接器由 ConnectorItem 统一绘制
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
 
-    def set_line(self, line: QLineF) -> None:
+    def set_line(self, x1: float, y1: float, x2: float, y2: float) -> None:
         """设置线段并初始化最后位置。
 
         Args:
-            line: 线段对象。
+            x1: 起点 X 坐标。
+            y1: 起点 Y 坐标。
+            x2: 终点 X 坐标。
+            y2: 终点 Y 坐标。
         """
         self.m_last_pos = self.pos().toPoint()
-        super().setLine(line)
+        self.setLine(x1, y1, x2, y2)
 
-    def paint(
-        self,
-        painter: QPainter,
-        option: QStyleOptionGraphicsItem,
-        widget: Optional[QWidget] = None,
-    ) -> None:
-        """绘制线段项。
+    def setLine(self, *args) -> None:
+        """设置线段，并使缓存的形状路径失效。
 
         Args:
-            painter: 绘制器对象。
-            option: 样式选项。
-            widget: 绘制目标部件，默认为 None。
+            *args: 与 QGraphicsLineItem.setLine() 相同的参数。
         """
-        line = self.line()
-        if Globals.near_zero(line.length()):
-            return
-
-        painter.save()
-        if self.m_is_highlighted:
-            pen = QPen()
-            pen.setWidthF(1.5 * self.m_connector.m_linewidth)
-            pen.setStyle(Qt.SolidLine)
-            pen.setColor(QColor(0, 0, 110))
-            if self.isSelected():
-                pen.setColor(QColor(192, 0, 0))
-                pen.setStyle(Qt.DashLine)
-            painter.setPen(pen)
-            painter.drawLine(line)
-        else:
-            pen = QPen()
-            pen.setWidthF(self.m_connector.m_linewidth)
-            pen.setColor(self.m_connector.m_color)
-            pen.setStyle(Qt.SolidLine)
-            if self.isSelected():
-                pen.setWidthF(1.5 * self.m_connector.m_linewidth)
-                pen.setColor(QColor(192, 0, 0))
-                pen.setStyle(Qt.DashLine)
-            painter.setPen(pen)
-            painter.drawLine(line)
-
-        # Draw text if this is the central segment
-        if (
-            self.m_connector.m_text
-            and self.m_segment_idx == self._calculate_central_segment_index()
-        ):
-            x = line.p1().x() + line.dx() / 2
-            y = line.p1().y() + line.dy() / 2
-            br = painter.boundingRect(
-                int(x), int(y), 150, 30, 0, self.m_connector.m_text
-            )
-            width = 1.2 * br.width()
-            height = 1.2 * br.height()
-            rect = QRectF(x - width / 2, y - height / 2, width, height)
-            pen = QPen()
-            pen.setWidthF(1)
-            pen.setColor(self.m_connector.m_color)
-            pen.setStyle(Qt.SolidLine)
-            painter.setPen(pen)
-            painter.setBrush(QBrush(Qt.white))
-            painter.drawRect(rect)
-            painter.drawText(rect, Qt.AlignCenter, self.m_connector.m_text)
-
-        painter.restore()
+        self.m_shape = None
+        super().setLine(*args)
 
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
         """处理鼠标悬停进入事件。
@@ -162,8 +112,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         """
         QGraphicsItem.hoverEnterEvent(self, event)
         scene_manager = self.scene()
-        from .scene_manager import SceneManager
-
+        SceneManager = scene_manager_class()
         if (
             isinstance(scene_manager, SceneManager)
             and scene_manager.is_currently_connecting
@@ -188,8 +137,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         """
         QGraphicsItem.hoverLeaveEvent(self, event)
         scene_manager = self.scene()
-        from .scene_manager import SceneManager
-
+        SceneManager = scene_manager_class()
         if (
             isinstance(scene_manager, SceneManager)
             and scene_manager.is_currently_connecting
@@ -208,8 +156,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
             event: 鼠标事件对象。
         """
         scene_manager = self.scene()
-        from .scene_manager import SceneManager
-
+        SceneManager = scene_manager_class()
         if isinstance(scene_manager, SceneManager):
             scene_manager.clearSelection()
         self.setSelected(True)
@@ -225,8 +172,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
             self.setSelected(True)
             event.accept()
             scene_manager = self.scene()
-            from .scene_manager import SceneManager
-
+            SceneManager = scene_manager_class()
             if isinstance(scene_manager, SceneManager):
                 scene_manager.on_selection_changed()
             return
@@ -236,8 +182,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
             self.setSelected(True)
             event.accept()
             scene_manager = self.scene()
-            from .scene_manager import SceneManager
-
+            SceneManager = scene_manager_class()
             if isinstance(scene_manager, SceneManager):
                 scene_manager.on_selection_changed()
             self.update()
@@ -246,8 +191,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         super().mouseReleaseEvent(event)
         self.m_moved = False
         scene_manager = self.scene()
-        from .scene_manager import SceneManager
-
+        SceneManager = scene_manager_class()
         if isinstance(scene_manager, SceneManager):
             scene_manager.merge_connector_segments(self.m_connector)
             scene_manager.on_selection_changed()
@@ -277,8 +221,7 @@ class ConnectorSegmentItem(QGraphicsLineItem):
 
                 # Manually correct the line's coordinates
                 scene_manager = self.scene()
-                from .scene_manager import SceneManager
-
+                SceneManager = scene_manager_class()
                 if isinstance(scene_manager, SceneManager):
                     scene_manager.connector_segment_moved(self)
 
@@ -297,8 +240,11 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         """获取线段项的形状。
 
         Returns:
-            线段项的形状路径。
+            线段项的形状路径（缓存结果）。
         """
+        if self.m_shape is not None:
+            return self.m_shape
+
         path = QPainterPath()
         line = self.line()
         x = line.p1().x() - 10
@@ -307,18 +253,9 @@ class ConnectorSegmentItem(QGraphicsLineItem):
         dy = line.dy() + 20
         rect = QRectF(x, y, dx, dy)
         path.addRect(rect)
+        self.m_shape = path
         return path
 
-    def _calculate_central_segment_index(self) -> int:
-        """计算中心线段的索引。
-
-        Returns:
-            中心线段的索引。
-        """
-        if len(self.m_connector.m_segments) <= 2:
-            return 0
-        return (len(self.m_connector.m_segments) - 2) // 2 + 1
-
     def _update_segments(self, move_dist: QPoint) -> None:
         """更新连接器线段的偏移量。
 
@@ -34,7 +34,10 @@
 #  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import ClassVar
+from typing import ClassVar, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .scene_manager import SceneManager
 
 
 class Globals:
@@ -65,3 +68,23 @@ class Globals:
             如果距离近似为零，返回 True，否则返回 False。
         """
         return abs(grid_distance / Globals.GridSpacing) < 1e-6
+
+
+# 延迟绑定的 SceneManager 类（scene_manager 模块导入了各图形项模块，图形项模块不能在模块顶层导入它）
+_scene_manager_cls: Optional[Type["SceneManager"]] = None
+
+
+def scene_manager_class() -> Type["SceneManager"]:
+    """获取 SceneManager 类，首次调用时导入并缓存。
+
+    供各图形项在事件和绘制处理中做 isinstance 判断，避免每次调用都执行局部导入。
+
+    Returns:
+        SceneManager 类。
+    """
+    global _scene_manager_cls
+    if _scene_manager_cls is None:
+        from .scene_manager import SceneManager
+
+        _scene_manager_cls = SceneManager
+    return _scene_manager_cls
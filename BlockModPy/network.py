@@ -37,11 +37,12 @@
 from __future__ import annotations
 
 import os
-from typing import List, Set, Tuple
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+from xml.etree import ElementTree
 
 from qtpy.QtCore import (
-    QFile,
-    QIODevice,
+    QByteArray,
     Qt,
     QXmlStreamReader,
     QXmlStreamWriter,
@@ -50,7 +51,10 @@ from qtpy.QtCore import (
 from .block import Block
 from .connector import Connector
 from .globals import Globals
-from .socket import Socket
+from .socket import Socket, decode_socket_positions
+
+# XML 文件读写的缓冲区大小，整块读入/写出以减少系统调用次数
+_XML_BUFFER_SIZE = 64 * 1024
 
 
 class Network:
@@ -60,6 +64,12 @@ class Network:
         """初始化网络对象。"""
         self.m_blocks: List[Block] = []
         self.m_connectors: List[Connector] = []
+        # 连接器端点解析缓存：连接器 ->
+        # (源插槽名, 目标插槽名, 源块, 源插槽, 目标块, 目标插槽, 源块插槽列表, 目标块插槽列表)
+        self.m_resolved_endpoints: Dict[
+            Connector,
+            Tuple[str, str, Block, Socket, Block, Socket, List[Socket], List[Socket]],
+        ] = {}
 
     def swap(self, other: Network) -> None:
         """交换两个网络对象的内容。
@@ -69,12 +79,18 @@ class Network:
         """
         self.m_blocks, other.m_blocks = other.m_blocks, self.m_blocks
         self.m_connectors, other.m_connectors = other.m_connectors, self.m_connectors
+        self.invalidate_resolved_endpoints()
+        other.invalidate_resolved_endpoints()
 
-    def read_xml(self, fname: str) -> None:
+    def read_xml(self, fname: str, use_stream_reader: bool = False) -> None:
         """从 XML 文件中读取网络数据。
 
+        默认使用 ElementTree 的 iterparse 增量解析（分词在 C 层完成），
+        每读完一个块或连接器元素即释放，内存占用与文件大小无关。
+
         Args:
             fname: XML 文件的路径。
+            use_stream_reader: 为 True 时改用原先基于 QXmlStreamReader 的逐标记解析。
 
         Raises:
             RuntimeError: 如果文件无法读取或 XML 格式错误。
@@ -82,11 +98,17 @@ class Network:
         if not os.path.exists(fname):
             raise RuntimeError(f"Cannot read file: {fname} does not exist.")
 
-        file = QFile(fname)
-        if not file.open(QIODevice.ReadOnly | QFile.Text):
+        if not use_stream_reader:
+            self._read_xml_iterparse(fname)
+            return
+
+        try:
+            with open(fname, "rb", buffering=_XML_BUFFER_SIZE) as file:
+                data = file.read()
+        except OSError:
             raise RuntimeError("Cannot open file for reading.")
 
-        reader = QXmlStreamReader(file)
+        reader = QXmlStreamReader(QByteArray(data))
 
         while not reader.atEnd() and not reader.hasError():
             reader.readNext()
@@ -111,22 +133,70 @@ class Network:
         if reader.hasError():
             raise RuntimeError(reader.errorString())
 
-        file.close()
+    def _read_xml_iterparse(self, fname: str) -> None:
+        """使用 ElementTree.iterparse 从 XML 文件中读取网络数据。
+
+        Args:
+            fname: XML 文件的路径。
+
+        Raises:
+            RuntimeError: 如果文件无法读取或 XML 格式错误。
+        """
+        depth = 0
+        section = None
+        # 插槽位置在整个文件读完后统一批量解码
+        pending_positions: List[Tuple[Socket, str]] = []
+        try:
+            file = open(fname, "rb", buffering=_XML_BUFFER_SIZE)
+        except OSError:
+            raise RuntimeError("Cannot open file for reading.")
+
+        try:
+            for event, elem in ElementTree.iterparse(file, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        if elem.tag != "BlockMod":
+                            raise RuntimeError("Expected BlockMod XML tag.")
+                    elif depth == 2:
+                        if elem.tag not in ("Blocks", "Connectors"):
+                            raise RuntimeError(f"Unknown tag '{elem.tag}'.")
+                        section = elem
+                    continue
+
+                depth -= 1
+                if depth != 2:
+                    continue
+                # 区段的直接子元素已完整读入，转换后立即从区段中移除
+                if section.tag == "Blocks" and elem.tag == "Block":
+                    block = Block()
+                    block.read_xml_element(elem, pending_positions)
+                    self.m_blocks.append(block)
+                elif section.tag == "Connectors" and elem.tag == "Connector":
+                    connector = Connector()
+                    connector.read_xml_element(elem)
+                    self.m_connectors.append(connector)
+                section.clear()
+        except ElementTree.ParseError as e:
+            raise RuntimeError(str(e))
+        finally:
+            file.close()
+
+        decode_socket_positions(pending_positions)
 
     def write_xml(self, fname: str) -> None:
         """将网络数据写入 XML 文件。
 
+        文档先完整写入内存缓冲区，再一次性写出到文件。
+
         Args:
             fname: XML 文件的路径。
 
         Raises:
             RuntimeError: 如果文件无法创建或写入。
         """
-        file = QFile(fname)
-        if not file.open(QIODevice.WriteOnly | QFile.Truncate | QFile.Text):
-            raise RuntimeError("Cannot create output file.")
-
-        writer = QXmlStreamWriter(file)
+        data = QByteArray()
+        writer = QXmlStreamWriter(data)
         writer.setAutoFormatting(True)
         writer.setAutoFormattingIndent(-1)
         writer.writeStartDocument()
@@ -149,7 +219,12 @@ class Network:
 
         writer.writeEndElement()  # BlockMod
         writer.writeEndDocument()
-        file.close()
+
+        try:
+            with open(fname, "wb", buffering=_XML_BUFFER_SIZE) as file:
+                file.write(data.data())
+        except OSError:
+            raise RuntimeError("Cannot create output file.")
 
     def check_names(self, print_names: bool = False) -> None:
         """检查块和插槽的名称是否有效。
@@ -246,38 +321,71 @@ class Network:
         Raises:
             RuntimeError: 如果连接器的插槽无效。
         """
-        source_block, source_socket = self.lookup_block_and_socket(
-            connector.m_source_socket
+        source_block, source_socket, target_block, target_socket = (
+            self.resolve_connector(connector)
         )
-        target_block, target_socket = self.lookup_block_and_socket(
-            connector.m_target_socket
+        self._apply_adjustment(
+            connector, source_block, source_socket, target_block, target_socket
         )
 
-        start_line = source_block.socket_start_line(source_socket)
-        end_line = target_block.socket_start_line(target_socket)
+    def can_adjust_connector(self, connector: Connector) -> bool:
+        """检查连接器的两端是否都能解析到有效的插槽，不抛出异常。
+
+        加载网络时可先用该方法过滤无效连接器，避免逐个捕获 adjust_connector() 的异常。
 
-        dx = end_line.p2().x() - start_line.p2().x()
-        dy = end_line.p2().y() - start_line.p2().y()
+        Args:
+            connector: 需要检查的连接器对象。
 
+        Returns:
+            两端插槽都有效时返回 True，否则返回 False。
+        """
+        return self._resolve_endpoints(connector)[0] is not None
+
+    @staticmethod
+    def _apply_adjustment(
+        connector: Connector,
+        source_block: Block,
+        source_socket: Socket,
+        target_block: Block,
+        target_socket: Socket,
+    ) -> None:
+        """根据已解析的端点调整连接器的线段，使其两端与插槽对齐。
+
+        Args:
+            connector: 需要调整的连接器对象。
+            source_block: 源块。
+            source_socket: 源插槽。
+            target_block: 目标块。
+            target_socket: 目标插槽。
+        """
+        start = source_block.socket_start_line(source_socket).p2()
+        end = target_block.socket_start_line(target_socket).p2()
+
+        dx = end.x() - start.x()
+        dy = end.y() - start.y()
+
+        # 一次遍历同时扣除已有偏移并记下第一条水平、竖直线段
+        first_horizontal = None
+        first_vertical = None
         for segment in connector.m_segments:
             if segment.m_direction == Qt.Horizontal:
                 dx -= segment.m_offset
+                if first_horizontal is None:
+                    first_horizontal = segment
             else:
                 dy -= segment.m_offset
+                if first_vertical is None and segment.m_direction == Qt.Vertical:
+                    first_vertical = segment
 
         if not Globals.near_zero(dy):
-            for segment in connector.m_segments:
-                if segment.m_direction == Qt.Vertical:
-                    segment.m_offset += dy
-                    break
+            if first_vertical is not None:
+                first_vertical.m_offset += dy
             else:
                 connector.m_segments.append(Connector.Segment(Qt.Vertical, dy))
 
         if not Globals.near_zero(dx):
-            for segment in connector.m_segments:
-                if segment.m_direction == Qt.Horizontal:
-                    segment.m_offset += dx
-                    break
+            if first_horizontal is not None:
+                first_horizontal.m_offset += dx
             else:
                 connector.m_segments.append(Connector.Segment(Qt.Horizontal, dx))
 
@@ -293,20 +401,115 @@ class Network:
         Raises:
             RuntimeError: 如果名称无效。
         """
-        block_name, socket_name = self._split_flat_name(flat_name)
+        found, error = self._find_flat_name(flat_name)
+        if found is None:
+            raise RuntimeError(error)
+        return found
 
+    def _find_block_and_socket(
+        self, block_name: str, socket_name: str
+    ) -> Optional[Tuple[Block, Socket]]:
+        """根据块名称和插槽名称查找块和插槽，找不到时返回 None。
+
+        Args:
+            block_name: 块名称。
+            socket_name: 插槽名称。
+
+        Returns:
+            包含块和插槽的元组；块或插槽不存在时返回 None。
+        """
         # 搜索 Block 对象
         block = next((b for b in self.m_blocks if b.m_name == block_name), None)
         if block is None:
-            raise RuntimeError("Invalid flat name.")
+            return None
 
         # 搜索 Socket 对象
         socket = next((s for s in block.m_sockets if s.m_name == socket_name), None)
         if socket is None:
-            raise RuntimeError("Invalid flat name.")
+            return None
 
         return block, socket
 
+    def resolve_connector(
+        self, connector: Connector
+    ) -> Tuple[Block, Socket, Block, Socket]:
+        """解析连接器的源和目标端点，并缓存解析结果。
+
+        缓存以连接器的源/目标插槽名称为键，名称变化时自动重新解析；
+        块的插槽列表被整体替换（如 Block.set_sockets()）时也会重新解析。
+        块被移除时需调用 invalidate_resolved_endpoints() 清空缓存，
+        连接器被移除时需调用 invalidate_resolved_connector() 移除其缓存项。
+
+        Args:
+            connector: 需要解析的连接器对象。
+
+        Returns:
+            (源块, 源插槽, 目标块, 目标插槽) 元组。
+
+        Raises:
+            RuntimeError: 如果插槽名称无效。
+        """
+        resolved, error = self._resolve_endpoints(connector)
+        if resolved is None:
+            raise RuntimeError(error)
+        return resolved
+
+    def _resolve_endpoints(
+        self, connector: Connector
+    ) -> Tuple[Optional[Tuple[Block, Socket, Block, Socket]], Optional[str]]:
+        """解析连接器的源和目标端点，失败时返回错误信息而不抛出异常。
+
+        解析结果与 resolve_connector() 共用同一缓存。
+
+        Args:
+            connector: 需要解析的连接器对象。
+
+        Returns:
+            ((源块, 源插槽, 目标块, 目标插槽), None)；
+            任一端点无效时返回 (None, 该端点的错误信息)。
+        """
+        cached = self.m_resolved_endpoints.get(connector)
+        if (
+            cached is not None
+            and cached[0] == connector.m_source_socket
+            and cached[1] == connector.m_target_socket
+            and cached[6] is cached[2].m_sockets
+            and cached[7] is cached[4].m_sockets
+        ):
+            return (cached[2], cached[3], cached[4], cached[5]), None
+
+        source, error = self._find_flat_name(connector.m_source_socket)
+        if source is None:
+            return None, error
+        target, error = self._find_flat_name(connector.m_target_socket)
+        if target is None:
+            return None, error
+        source_block, source_socket = source
+        target_block, target_socket = target
+        self.m_resolved_endpoints[connector] = (
+            connector.m_source_socket,
+            connector.m_target_socket,
+            source_block,
+            source_socket,
+            target_block,
+            target_socket,
+            source_block.m_sockets,
+            target_block.m_sockets,
+        )
+        return (source_block, source_socket, target_block, target_socket), None
+
+    def invalidate_resolved_endpoints(self) -> None:
+        """清空连接器端点解析缓存。"""
+        self.m_resolved_endpoints.clear()
+
+    def invalidate_resolved_connector(self, connector: Connector) -> None:
+        """移除单个连接器的端点解析缓存项，连接器被移除时调用。
+
+        Args:
+            connector: 被移除的连接器对象。
+        """
+        self.m_resolved_endpoints.pop(connector, None)
+
     def remove_block(self, block_idx: int) -> None:
         """移除指定索引的块及其相关连接器。
 
@@ -334,6 +537,7 @@ class Network:
 
         # Remove the block
         self.m_blocks.pop(block_idx)
+        self.invalidate_resolved_endpoints()
 
     def rename_block(self, block_idx: int, new_name: str) -> None:
         """重命名指定索引的块，并更新相关连接器。
@@ -350,19 +554,38 @@ class Network:
 
         block = self.m_blocks[block_idx]
         old_name = block.m_name
-        block.m_name = new_name
+        block.m_name = sys.intern(new_name)
 
         # Update connectors
         for connector in self.m_connectors:
             if connector.m_source_socket.startswith(old_name + "."):
-                connector.m_source_socket = (
+                connector.m_source_socket = sys.intern(
                     new_name + connector.m_source_socket[len(old_name) :]
                 )
             if connector.m_target_socket.startswith(old_name + "."):
-                connector.m_target_socket = (
+                connector.m_target_socket = sys.intern(
                     new_name + connector.m_target_socket[len(old_name) :]
                 )
 
+    def _find_flat_name(
+        self, flat_name: str
+    ) -> Tuple[Optional[Tuple[Block, Socket]], Optional[str]]:
+        """根据完整名称查找块和插槽，不抛出异常。
+
+        Args:
+            flat_name: 完整名称（格式为 "block.socket"）。
+
+        Returns:
+            ((块, 插槽), None)；名称格式无效或找不到时返回 (None, 错误信息)。
+        """
+        names = self._try_split_flat_name(flat_name)
+        if names is None:
+            return None, self._bad_flat_name_message(flat_name)
+        found = self._find_block_and_socket(*names)
+        if found is None:
+            return None, f"Invalid flat name '{flat_name}'."
+        return found, None
+
     @staticmethod
     def _split_flat_name(flat_name: str) -> Tuple[str, str]:
         """将完整名称拆分为块名称和插槽名称。
@@ -376,13 +599,38 @@ class Network:
         Raises:
             RuntimeError: 如果名称格式无效。
         """
-        if "." not in flat_name:
-            raise RuntimeError(
-                f"Bad flat name '{flat_name}', expected 'block.socket' format."
-            )
-        dot_index = flat_name.index(".")
+        names = Network._try_split_flat_name(flat_name)
+        if names is None:
+            raise RuntimeError(Network._bad_flat_name_message(flat_name))
+        return names
+
+    @staticmethod
+    def _try_split_flat_name(flat_name: str) -> Optional[Tuple[str, str]]:
+        """将完整名称拆分为块名称和插槽名称，格式无效时返回 None。
+
+        Args:
+            flat_name: 完整名称（格式为 "block.socket"）。
+
+        Returns:
+            包含块名称和插槽名称的元组；名称中没有 "." 时返回 None。
+        """
+        dot_index = flat_name.find(".")
+        if dot_index < 0:
+            return None
         return flat_name[:dot_index].strip(), flat_name[dot_index + 1 :].strip()
 
+    @staticmethod
+    def _bad_flat_name_message(flat_name: str) -> str:
+        """生成名称格式无效时的错误信息。
+
+        Args:
+            flat_name: 格式无效的完整名称。
+
+        Returns:
+            错误信息。
+        """
+        return f"Bad flat name '{flat_name}', expected 'block.socket' format."
+
     def _read_blocks(self, reader: QXmlStreamReader) -> None:
         """从 XML 读取块数据。
 
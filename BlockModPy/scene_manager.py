@@ -34,11 +34,13 @@
 #  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Union, List, Dict, Set, Optional
+import sys
+from contextlib import contextmanager
+from typing import Union, List, Dict, Set, Optional, Tuple, Iterable, Iterator
 
 from qtpy.QtCore import Qt, QPointF, QSize, QRectF, QLineF, QSizeF
-from qtpy.QtCore import Signal
-from qtpy.QtGui import QPixmap, QPainter
+from qtpy.QtCore import Signal, QTimer
+from qtpy.QtGui import QPixmap, QPainter, QImage
 from qtpy.QtWidgets import (
     QGraphicsScene,
     QGraphicsItem,
@@ -48,7 +50,8 @@ from qtpy.QtWidgets import (
 
 from .block import Block
 from .block_item import BlockItem
-from .connector import Connector
+from .connector import Connector, RouteTemplate
+from .connector_item import ConnectorItem
 from .connector_segment_item import ConnectorSegmentItem
 from .globals import Globals
 from .network import Network
@@ -72,9 +75,22 @@ class SceneManager(QGraphicsScene):
 
         m_network: 当前关联的网络数据模型。
         m_block_items: 场景中的块图形项列表。
-        m_connector_segment_items: 连接器线段图形项列表。
+        m_block_item_by_name: 块名称到块图形项的索引。
+        m_connector_segment_items: 全部连接器线段图形项（以 id(图形项) 为键）。
+        m_segment_items_by_connector: 连接器到其线段图形项列表的索引。
+        m_connector_items: 连接器到其绘制图形项（整条路径一次绘制）的映射。
+        m_hovered_sockets: 连接过程中当前处于悬停高亮状态的插槽图形项集合。
         m_block_connector_map: 块到其关联连接器的映射。
+        m_connector_block_map: 连接器到其关联块的反向映射。
+        m_connected_sockets: 已连接插槽 (id(块), id(插槽)) 到连接器数量的计数。
+        m_connector_socket_keys: 连接器到其端点插槽键（及所属块和插槽）的映射。
         m_currently_connecting: 标记当前是否处于连接创建状态。
+        m_hover_timer: 连接过程中用于合并鼠标移动事件的单次定时器。
+        m_selected_items: 当前选中的图形项集合（随 selectionChanged 增量更新）。
+        m_selected_block_items: 当前选中的块图形项集合。
+        m_selected_connectors: 当前选中的连接器及其被选中的线段数量。
+        m_geometry_change_depth: 延迟发出 network_geometry_changed 的嵌套层数。
+        m_geometry_change_pending: 延迟期间是否有待发出的几何变化通知。
     """
 
     network_geometry_changed: Signal = Signal()
@@ -91,11 +107,44 @@ class SceneManager(QGraphicsScene):
             parent (QObject, optional): 父对象。默认为 None。
         """
         super().__init__(parent)
+        # 使用场景自带的 BSP 树索引进行空间查询（连接过程中的插槽命中测试）
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.m_network: Network = Network()
         self.m_block_items: List[BlockItem] = []
-        self.m_connector_segment_items: List[ConnectorSegmentItem] = []
+        self.m_block_item_by_name: Dict[str, BlockItem] = {}
+        self.m_connector_segment_items: Dict[int, ConnectorSegmentItem] = {}
+        self.m_segment_items_by_connector: Dict[
+            Connector, List[ConnectorSegmentItem]
+        ] = {}
+        self.m_connector_items: Dict[Connector, ConnectorItem] = {}
         self.m_block_connector_map: Dict[Block, Set[Connector]] = {}
+        self.m_connector_block_map: Dict[Connector, Set[Block]] = {}
+        # 已连接插槽的引用计数：(id(块), id(插槽)) -> 连接器数量；
+        # 按对象标识而非名称计数，块或插槽重命名后计数仍然有效
+        self.m_connected_sockets: Dict[Tuple[int, int], int] = {}
+        # 键对应的块和插槽对象一并保存，保证登记期间对象不会被回收、id 不会被复用
+        self.m_connector_socket_keys: Dict[
+            Connector, Dict[Tuple[int, int], Tuple[Block, Socket]]
+        ] = {}
         self.m_currently_connecting: bool = False
+        self.m_hovered_sockets: Set[SocketItem] = set()
+        # 连接过程中合并鼠标移动事件，每个周期最多执行一次插槽命中测试
+        self.m_hover_timer = QTimer(self)
+        self.m_hover_timer.setSingleShot(True)
+        self.m_hover_timer.setInterval(16)
+        self.m_hover_timer.timeout.connect(
+            self.update_connection_hover, Qt.DirectConnection
+        )
+        # 连接器上次更新时的几何键（路由模板 + 起止线段坐标）
+        self.m_connector_geometry: Dict[Connector, tuple] = {}
+        # 选中状态的增量索引
+        self.m_selected_items: Set[QGraphicsItem] = set()
+        self.m_selected_block_items: Set[BlockItem] = set()
+        self.m_selected_connectors: Dict[Connector, int] = {}
+        self.selectionChanged.connect(self.update_selection_sets, Qt.DirectConnection)
+        # 批量操作期间合并几何变化通知
+        self.m_geometry_change_depth: int = 0
+        self.m_geometry_change_pending: bool = False
 
     def __del__(self) -> None:
         del self.m_network
@@ -107,30 +156,71 @@ class SceneManager(QGraphicsScene):
     def set_network(self, network: Network) -> None:
         """设置网络对象，并同步场景中的块和连接器。
 
-        移除原有块和连接器项，根据新网络对象重建图形项。
+        仍在新网络中的块和连接器（按对象身份判断）复用原有图形项，
+        只为新增的对象创建图形项，并移除已不存在对象的图形项。
 
         Args:
             network: 需要设置的新网络对象。
         """
         self.m_network = network
-        for item in self.m_block_items:
-            self.removeItem(item)
-        self.m_block_items.clear()
-        for item in self.m_connector_segment_items:
-            self.removeItem(item)
-        self.m_connector_segment_items.clear()
-        self.m_block_connector_map.clear()
+        self.m_network.invalidate_resolved_endpoints()
 
-        for block in self.m_network.m_blocks:
-            item = self.create_block_item(block)
-            self.addItem(item)
-            self.m_block_items.append(item)
+        # 批量增删图形项期间关闭场景索引，结束后由首次查询统一重建
+        index_method = self.itemIndexMethod()
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            # 移除已不在新网络中的块和连接器的图形项
+            old_block_items = {item.m_block: item for item in self.m_block_items}
+            new_blocks = set(self.m_network.m_blocks)
+            for block, item in old_block_items.items():
+                if block not in new_blocks:
+                    self.removeItem(item)
+            new_connectors = set(self.m_network.m_connectors)
+            self._remove_connectors_items(
+                [
+                    con
+                    for con in self.m_segment_items_by_connector
+                    if con not in new_connectors
+                ]
+            )
 
-        for connector in self.m_network.m_connectors:
-            new_conns = self.create_connector_items(connector)
-            for item in new_conns:
-                self.addItem(item)
-                self.m_connector_segment_items.append(item)
+            for si in self.m_hovered_sockets:
+                si.m_hovered = False
+                si.update()
+            self.m_hovered_sockets.clear()
+            # 连接状态将重新登记，先让仍保留的插槽图形项刷新缓存
+            for keys in self.m_connector_socket_keys.values():
+                for block, socket in keys.values():
+                    self._update_socket_item(block, socket)
+            self.m_block_items.clear()
+            self.m_block_item_by_name.clear()
+            self.m_block_connector_map.clear()
+            self.m_connector_block_map.clear()
+            self.m_connected_sockets.clear()
+            self.m_connector_socket_keys.clear()
+
+            # 按网络中的顺序重建块列表，复用已有的块图形项
+            for block in self.m_network.m_blocks:
+                item = old_block_items.get(block)
+                if item is None:
+                    self._add_block_item(self.create_block_item(block))
+                    continue
+                if item.pos() != block.m_pos:
+                    item.setPos(block.m_pos)
+                self.m_block_items.append(item)
+                self.m_block_item_by_name[block.m_name] = item
+
+            # 复用已有连接器的线段图形项，仅在几何变化时更新
+            for connector in self.m_network.m_connectors:
+                if connector in self.m_segment_items_by_connector:
+                    self._register_connector_blocks(connector)
+                    self.update_connector_segment_items(connector, None)
+                else:
+                    self._add_connector_segment_items(
+                        self.create_connector_items(connector)
+                    )
+        finally:
+            self.setItemIndexMethod(index_method)
 
         self.m_currently_connecting = False
 
@@ -182,12 +272,13 @@ class SceneManager(QGraphicsScene):
             border_size, border_size, w - 2 * border_size, h - 2 * border_size
         )
 
-        pm = QPixmap(target_size)
-        pm.fill(Qt.white)
-        painter = QPainter(pm)
+        # 先在光栅图像上绘制，再一次性转换为 QPixmap
+        image = QImage(target_size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.white)
+        painter = QPainter(image)
         self.render(painter, target_rect, source_rect)
         painter.end()
-        return pm
+        return QPixmap.fromImage(image)
 
     def block_item_by_name(self, block_name: str) -> Optional[BlockItem]:
         """根据块名称查找对应的块项。
@@ -198,8 +289,14 @@ class SceneManager(QGraphicsScene):
         Returns:
             如果找到则返回块项，否则返回 None。
         """
+        item = self.m_block_item_by_name.get(block_name)
+        if item is not None and item.m_block.m_name == block_name:
+            return item
+
+        # 块可能在建立索引后被重命名，回退到线性查找并修正索引
         for item in self.m_block_items:
             if item.m_block.m_name == block_name:
+                self.m_block_item_by_name[block_name] = item
                 return item
         return None
 
@@ -220,7 +317,7 @@ class SceneManager(QGraphicsScene):
         for con in cons:
             self.m_network.adjust_connector(con)
             self.update_connector_segment_items(con, None)
-        self.network_geometry_changed.emit()
+        self.notify_geometry_changed()
 
     def block_selected(self, block: Block) -> None:
         """当块被选中时，触发信号并发送块的名称。
@@ -239,7 +336,34 @@ class SceneManager(QGraphicsScene):
             current_item: 当前被移动的连接线段项。
         """
         self.update_connector_segment_items(current_item.m_connector, current_item)
-        self.network_geometry_changed.emit()
+        self.notify_geometry_changed()
+
+    def notify_geometry_changed(self) -> None:
+        """发出网络几何变化信号；处于延迟区间内时仅做标记，退出时统一发出。"""
+        if self.m_geometry_change_depth > 0:
+            self.m_geometry_change_pending = True
+        else:
+            self.network_geometry_changed.emit()
+
+    @contextmanager
+    def deferred_geometry_changes(self) -> Iterator[None]:
+        """在批量操作期间合并 network_geometry_changed 信号。
+
+        区间内的多次几何变化只在最外层区间退出时发出一次信号。
+
+        Examples:
+            with scene_manager.deferred_geometry_changes():
+                for item in items:
+                    item.setPos(item.pos() + offset)
+        """
+        self.m_geometry_change_depth += 1
+        try:
+            yield
+        finally:
+            self.m_geometry_change_depth -= 1
+            if self.m_geometry_change_depth == 0 and self.m_geometry_change_pending:
+                self.m_geometry_change_pending = False
+                self.network_geometry_changed.emit()
 
     def highlight_connector_segments(self, con: Connector, highlighted: bool) -> None:
         """高亮或取消高亮连接器中的所有线段。
@@ -248,11 +372,17 @@ class SceneManager(QGraphicsScene):
             con: 需要高亮的连接器对象。
             highlighted: 是否高亮，True 为高亮，False 为取消高亮。
         """
-        for segment_item in self.m_connector_segment_items:
-            if segment_item.m_connector == con:
-                segment_item.m_is_highlighted = highlighted
-                segment_item.update()
-        self.update()
+        for segment_item in self.m_segment_items_by_connector.get(con, ()):
+            segment_item.m_is_highlighted = highlighted
+
+        # 只重绘状态发生变化的连接器，不再刷新整个场景
+        connector_item = self.m_connector_items.get(con)
+        if (
+            connector_item is not None
+            and connector_item.m_is_highlighted != highlighted
+        ):
+            connector_item.m_is_highlighted = highlighted
+            connector_item.update()
 
     def select_connector_segments(self, con: Connector) -> None:
         """选中连接器的所有线段。
@@ -260,174 +390,66 @@ class SceneManager(QGraphicsScene):
         Args:
             con: 需要选中的连接器对象。
         """
-        for segment_item in self.m_connector_segment_items:
-            if segment_item.m_connector == con:
-                if not segment_item.isSelected():
-                    segment_item.setSelected(True)
-                segment_item.update()
-        self.update()
-
-    # def merge_connector_segments(self, con: Connector) -> None:
-    #     """合并连接器的线段。
-    #
-    #     Args:
-    #         con: 需要合并线段的连接器对象。
-    #     """
-    #     segment_items: List[ConnectorSegmentItem] = []
-    #     segment_items_dict = {}  # 临时存储索引到对象的映射
-    #
-    #     for segment_item in self.m_connector_segment_items:
-    #         if segment_item.m_connector == con:
-    #             idx = segment_item.m_segment_idx
-    #             if idx in {-1, -2}:
-    #                 continue
-    #             segment_items_dict[idx] = segment_item
-    #
-    #     # 根据 con.m_segments 的长度构建有序列表，并验证所有索引存在
-    #     expected_length = len(con.m_segments)
-    #     for idx in range(expected_length):
-    #         if idx not in segment_items_dict:
-    #             raise ValueError(f"缺少索引为{idx}的线段项")
-    #         segment_items.append(segment_items_dict[idx])
-    #
-    #     update_segments: bool = False
-    #     i = 0
-    #     while i < len(segment_items):
-    #         for i in range(len(segment_items)):
-    #             seg_item = segment_items[i]
-    #             seg = con.m_segments[i]
-    #             if i > 0 and con.m_segments[i - 1].m_direction == seg.m_direction:
-    #                 con.m_segments[i - 1].m_offset += seg.m_offset
-    #                 seg.m_offset = 0
-    #                 update_segments = True
-    #             if Globals.near_zero(seg.m_offset):
-    #                 break
-    #         if i == len(segment_items):
-    #             break
-    #
-    #         if i == 0:
-    #             con.m_segments.pop(0)
-    #             seg_item = segment_items.pop(0)
-    #             self.m_connector_segment_items.remove(seg_item)
-    #             del seg_item
-    #             for j in range(len(segment_items)):
-    #                 segment_items[j].m_segment_idx -= 1
-    #         elif i == len(segment_items) - 1:
-    #             con.m_segments.pop()
-    #             seg_item = segment_items.pop()
-    #             self.m_connector_segment_items.remove(seg_item)
-    #             del seg_item
-    #             i = 0
-    #         else:
-    #             con.m_segments.pop(i)
-    #             seg_item = segment_items.pop(i)
-    #             self.m_connector_segment_items.remove(seg_item)
-    #             del seg_item
-    #             for j in range(i, len(segment_items)):
-    #                 segment_items[j].m_segment_idx -= 1
-    #             if (
-    #                 i > 0
-    #                 and con.m_segments[i - 1].m_direction
-    #                 == con.m_segments[i].m_direction
-    #             ):
-    #                 con.m_segments[i - 1].m_offset += con.m_segments[i].m_offset
-    #                 con.m_segments.pop(i)
-    #                 seg_item = segment_items.pop(i)
-    #                 self.m_connector_segment_items.remove(seg_item)
-    #                 del seg_item
-    #                 for j in range(i, len(segment_items)):
-    #                     segment_items[j].m_segment_idx -= 1
-    #                 update_segments = True
-    #             i = 0
-    #
-    #     if update_segments:
-    #         self.update_connector_segment_items(con, None)
-    #     QApplication.restoreOverrideCursor()
-
-    def merge_connector_segments(self, con):
-        # 收集有序的 segmentItems 列表
-        segment_items = [None] * len(con.m_segments)
-
-        for segment_item in self.m_connector_segment_items:
-            if segment_item.m_connector == con:
-                if segment_item.m_segment_idx in (-1, -2):
-                    continue
-                assert segment_item.m_segment_idx < len(segment_items)
-                segment_items[segment_item.m_segment_idx] = segment_item
-
-        i = 0
-        update_segments = False
-
-        while i < len(segment_items):
-            i = 0
-            while i < len(segment_items):
-                seg_item = segment_items[i]
-                assert i == seg_item.m_segment_idx
-                seg = con.m_segments[i]
-
-                if i > 0 and con.m_segments[i - 1].m_direction == seg.m_direction:
-                    con.m_segments[i - 1].m_offset += seg.m_offset
-                    seg.m_offset = 0
-                    update_segments = True
-
-                if Globals.near_zero(seg.m_offset):
-                    break
-
-                i += 1
+        # setSelected() 会自行重绘发生变化的线段，无需再刷新整个场景
+        for segment_item in self.m_segment_items_by_connector.get(con, ()):
+            if not segment_item.isSelected():
+                segment_item.setSelected(True)
 
+    def merge_connector_segments(self, con: Connector) -> None:
+        """合并连接器的线段。
 
-            if i == len(segment_items):
-                break  # 没找到 zero-length segment，结束
+        单次遍历连接器的线段：与前一线段方向相同的线段并入前一线段，
+        长度接近零的线段被移除；合并后长度归零的线段同样被移除，
+        使其前后线段得以继续合并。
 
-            if i == 0:
-                con.m_segments.pop(0)
-                seg_item = segment_items.pop(0)
-                self.m_connector_segment_items.remove(seg_item)
-                # del seg_item
-                self.removeItem(seg_item)
-                del seg_item
-                for j in range(len(segment_items)):
-                    segment_items[j].m_segment_idx -= 1
-
-            elif i == len(segment_items) - 1:
-                con.m_segments.pop()
-                seg_item = segment_items.pop()
-                self.m_connector_segment_items.remove(seg_item)
-                # del seg_item
-                self.removeItem(seg_item)
-                del seg_item
-                i = 0
+        Args:
+            con: 需要合并线段的连接器对象。
+        """
+        # 收集有序的线段图形项列表（起始线和终止线除外）
+        segment_items: List[Optional[ConnectorSegmentItem]] = [None] * len(
+            con.m_segments
+        )
+        end_items: List[ConnectorSegmentItem] = []
+        for segment_item in self.m_segment_items_by_connector.get(con, ()):
+            if segment_item.m_segment_idx in (-1, -2):
+                end_items.append(segment_item)
+                continue
+            assert segment_item.m_segment_idx < len(segment_items)
+            segment_items[segment_item.m_segment_idx] = segment_item
 
-            else:
-                con.m_segments.pop(i)
-                seg_item = segment_items.pop(i)
-                self.m_connector_segment_items.remove(seg_item)
-                # del seg_item
+        update_segments = False
+        kept_segments: List[Connector.Segment] = []
+        kept_items: List[ConnectorSegmentItem] = []
+        removed_items: Set[ConnectorSegmentItem] = set()
+        for seg, seg_item in zip(con.m_segments, segment_items):
+            if kept_segments and kept_segments[-1].m_direction == seg.m_direction:
+                kept_segments[-1].m_offset += seg.m_offset
+                seg.m_offset = 0
+                update_segments = True
+                # 合并后前一线段长度归零时将其移除
+                if Globals.near_zero(kept_segments[-1].m_offset):
+                    kept_segments.pop()
+                    removed_items.add(kept_items.pop())
+            if Globals.near_zero(seg.m_offset):
+                removed_items.add(seg_item)
+                continue
+            kept_segments.append(seg)
+            kept_items.append(seg_item)
+
+        if removed_items:
+            con.m_segments[:] = kept_segments
+            for idx, seg_item in enumerate(kept_items):
+                seg_item.m_segment_idx = idx
+            self.m_segment_items_by_connector[con] = end_items + kept_items
+            for seg_item in removed_items:
+                self.m_connector_segment_items.pop(id(seg_item), None)
                 self.removeItem(seg_item)
-                del seg_item
-                for j in range(i, len(segment_items)):
-                    segment_items[j].m_segment_idx -= 1
-
-                previous_seg = con.m_segments[i - 1]
-                next_seg = con.m_segments[i]
-                if previous_seg.m_direction == next_seg.m_direction:
-                    previous_seg.m_offset += next_seg.m_offset
-                    con.m_segments.pop(i)
-                    seg_item = segment_items.pop(i)
-                    self.m_connector_segment_items.remove(seg_item)
-                    # del seg_item
-                    self.removeItem(seg_item)
-                    del seg_item
-                    for j in range(i, len(segment_items)):
-                        segment_items[j].m_segment_idx -= 1
-                    update_segments = True
-
-                i = 0
 
         if update_segments:
             self.update_connector_segment_items(con, None)
 
         QApplication.restoreOverrideCursor()
+
     def is_connected_socket(self, b: Block, s: Socket) -> bool:
         """判断一个插槽是否已经连接。
 
@@ -440,28 +462,7 @@ class SceneManager(QGraphicsScene):
         Returns:
             如果插槽已经连接则返回 True，否则返回 False。
         """
-        # 查找Block对应的连接器集合
-        connectors = self.m_block_connector_map.get(b)
-        if not connectors:
-            return False
-
-        # 遍历所有关联的连接器
-        for connector in connectors:
-            # 检查源socket
-            _, source_socket = self.m_network.lookup_block_and_socket(
-                connector.m_source_socket
-            )
-            if s is source_socket:
-                return True
-
-            # 检查目标socket
-            _, target_socket = self.m_network.lookup_block_and_socket(
-                connector.m_target_socket
-            )
-            if s is target_socket:
-                return True
-
-        return False
+        return (id(b), id(s)) in self.m_connected_sockets
 
     def start_socket_connection(
         self, outlet_socket_item: SocketItem, mouse_pos: QPointF
@@ -477,11 +478,8 @@ class SceneManager(QGraphicsScene):
         """
         assert not outlet_socket_item.socket.m_inlet
 
-        # 取消所有块和连接线段的选中状态
-        for block in self.m_block_items:
-            block.setSelected(False)
-        for segment_item in self.m_connector_segment_items:
-            segment_item.setSelected(False)
+        # 取消所有块和连接线段的选中状态（一次性清除，仅触发一次 selectionChanged）
+        self.clearSelection()
 
         # 获取出口插槽的父块和插槽信息
         bitem = outlet_socket_item.parentItem()
@@ -514,8 +512,8 @@ class SceneManager(QGraphicsScene):
         # 创建一个连接器，表示从出口插槽到虚拟插槽的连接
         con = Connector()
         con.m_name = Globals.InvisibleLabel
-        con.m_source_socket = start_socket_name
-        con.m_target_socket = target_socket_name
+        con.m_source_socket = sys.intern(start_socket_name)
+        con.m_target_socket = sys.intern(target_socket_name)
         self.m_network.m_connectors.append(con)
 
         # 创建虚拟块的图形项，并添加到场景中
@@ -532,12 +530,12 @@ class SceneManager(QGraphicsScene):
         bi.setPos(dummy_block.m_pos)
 
         self.addItem(bi)
+        self.m_block_item_by_name[dummy_block.m_name] = bi
 
         # 创建连接器的图形项，并添加到场景中
-        new_conns = self.create_connector_items(self.m_network.m_connectors[-1])
-        for item in new_conns:
-            self.addItem(item)
-            self.m_connector_segment_items.append(item)
+        self._add_connector_segment_items(
+            self.create_connector_items(self.m_network.m_connectors[-1])
+        )
 
         # 标记当前正在连接中
         self.m_currently_connecting = True
@@ -549,6 +547,7 @@ class SceneManager(QGraphicsScene):
         """
         if self.m_network.m_blocks and self.m_network.m_blocks[-1].m_name == Globals.InvisibleLabel:
             self.remove_block(len(self.m_network.m_blocks) - 1)
+        self.m_hover_timer.stop()
         self.m_currently_connecting = False
 
     def selected_blocks(self) -> List[Block]:
@@ -557,12 +556,7 @@ class SceneManager(QGraphicsScene):
         Returns:
             当前选中的所有块对象列表。
         """
-        selected = self.selectedItems()
-        selected_blocks = []
-        for item in selected:
-            if isinstance(item, BlockItem):
-                selected_blocks.append(item.block)
-        return selected_blocks
+        return [item.block for item in self.m_selected_block_items]
 
     def selected_connector(self) -> Optional[Connector]:
         """获取当前选中的连接器对象。
@@ -570,11 +564,41 @@ class SceneManager(QGraphicsScene):
         Returns:
             当前选中的连接器对象。如果未选中任何连接器，返回 None。
         """
-        selected = self.selectedItems()
-        for item in selected:
-            if isinstance(item, ConnectorSegmentItem):
-                return item.m_connector
-        return None
+        return next(iter(self.m_selected_connectors), None)
+
+    def update_selection_sets(self) -> None:
+        """根据场景当前的选中项增量更新选中状态索引。
+
+        连接到 selectionChanged 信号；若选中状态在信号被阻塞期间发生变化，
+        可手动调用此函数重新同步。
+        """
+        selected = set(self.selectedItems())
+        changed_connectors: Set[Connector] = set()
+        for item in self.m_selected_items - selected:
+            if isinstance(item, BlockItem):
+                self.m_selected_block_items.discard(item)
+            elif isinstance(item, ConnectorSegmentItem):
+                changed_connectors.add(item.m_connector)
+                count = self.m_selected_connectors.get(item.m_connector, 0) - 1
+                if count > 0:
+                    self.m_selected_connectors[item.m_connector] = count
+                else:
+                    self.m_selected_connectors.pop(item.m_connector, None)
+        for item in selected - self.m_selected_items:
+            if isinstance(item, BlockItem):
+                self.m_selected_block_items.add(item)
+            elif isinstance(item, ConnectorSegmentItem):
+                changed_connectors.add(item.m_connector)
+                self.m_selected_connectors[item.m_connector] = (
+                    self.m_selected_connectors.get(item.m_connector, 0) + 1
+                )
+        self.m_selected_items = selected
+
+        # 连接器的选中样式由其绘制图形项统一绘制
+        for con in changed_connectors:
+            connector_item = self.m_connector_items.get(con)
+            if connector_item is not None:
+                connector_item.update()
 
     def add_block(self, block: Block) -> None:
         """向网络中添加一个新块。
@@ -583,9 +607,7 @@ class SceneManager(QGraphicsScene):
             block: 需要添加的块对象。
         """
         self.m_network.m_blocks.append(block)
-        item = self.create_block_item(self.m_network.m_blocks[-1])
-        self.addItem(item)
-        self.m_block_items.append(item)
+        self._add_block_item(self.create_block_item(self.m_network.m_blocks[-1]))
 
     def add_connector(self, con: Connector) -> None:
         """向网络中添加一个新连接器。
@@ -643,43 +665,83 @@ class SceneManager(QGraphicsScene):
         assert 0 <= block_index < len(self.m_network.m_blocks)
         assert block_index < len(self.m_block_items)
 
-        # 获取与该块相关的所有连接器
-        related_connectors = list(self.m_block_connector_map.get(block_to_remove, set()))
-
-        # 删除所有相关连接器
-        for con in related_connectors:
-            if con in self.m_network.m_connectors:
-                self.m_network.m_connectors.remove(con)
+        # 获取与该块相关的所有连接器，仅移除这些连接器及其图形项
+        related_connectors = set(self.m_block_connector_map.get(block_to_remove, ()))
+        if related_connectors:
+            self.m_network.m_connectors[:] = [
+                con
+                for con in self.m_network.m_connectors
+                if con not in related_connectors
+            ]
+            self._remove_connectors_items(related_connectors)
 
         # 从块列表中删除该块
         block_item = self.m_block_items.pop(block_index)
+        if self.m_block_item_by_name.get(block_item.m_block.m_name) is block_item:
+            del self.m_block_item_by_name[block_item.m_block.m_name]
+        self.m_hovered_sockets.difference_update(block_item.m_socket_items)
         self.removeItem(block_item)
         del self.m_network.m_blocks[block_index]
+        self.m_network.invalidate_resolved_endpoints()
 
-        # 清空连接器项并重建
-        # 移除所有连接器图形项
-        while self.m_connector_segment_items:
-            item = self.m_connector_segment_items.pop()
-            self.removeItem(item)
-            del item
-
-        # 完全重建 m_block_connector_map
-        self.m_block_connector_map.clear()
-        for con in self.m_network.m_connectors:
-            # 更新源块的连接器关联
-            source_block, _ = self.m_network.lookup_block_and_socket(con.m_source_socket)
-            self.m_block_connector_map.setdefault(source_block, set()).add(con)
-            # 更新目标块的连接器关联
-            target_block, _ = self.m_network.lookup_block_and_socket(con.m_target_socket)
-            self.m_block_connector_map.setdefault(target_block, set()).add(con)
-
-        # 重新创建所有剩余连接器的图形项
-        self.m_connector_segment_items.clear()
-        for connector in self.m_network.m_connectors:
-            new_items = self.create_connector_items(connector)
-            for item in new_items:
-                self.addItem(item)
-                self.m_connector_segment_items.append(item)
+    def remove_blocks(self, blocks: Iterable[Block]) -> None:
+        """从网络中一次性移除多个块及其相关连接。
+
+        与逐个调用 remove_block() 相比，连接器列表和块列表只重建一次，
+        移除过程中不逐项发出 selectionChanged，结束后重新同步选中状态索引并统一发出一次。
+
+        Args:
+            blocks: 需要移除的块对象。
+
+        Raises:
+            RuntimeError: 如果某个块不在网络中。
+        """
+        # 按对象身份匹配，与 remove_block() 一致
+        to_remove = {id(b): b for b in blocks}
+        if not to_remove:
+            return
+        network_block_ids = {id(b) for b in self.m_network.m_blocks}
+        if not network_block_ids.issuperset(to_remove):
+            raise RuntimeError("[SceneManager::remove_blocks] 块不在网络中。")
+
+        # 收集所有相关连接器，连接器列表只过滤一次
+        related_connectors: Set[Connector] = set()
+        for b in to_remove.values():
+            related_connectors.update(self.m_block_connector_map.get(b, ()))
+
+        was_blocked = self.blockSignals(True)
+        try:
+            if related_connectors:
+                self.m_network.m_connectors[:] = [
+                    con
+                    for con in self.m_network.m_connectors
+                    if con not in related_connectors
+                ]
+                self._remove_connectors_items(related_connectors)
+
+            kept_items: List[BlockItem] = []
+            for block_item in self.m_block_items:
+                if id(block_item.m_block) not in to_remove:
+                    kept_items.append(block_item)
+                    continue
+                name = block_item.m_block.m_name
+                if self.m_block_item_by_name.get(name) is block_item:
+                    del self.m_block_item_by_name[name]
+                self.m_hovered_sockets.difference_update(block_item.m_socket_items)
+                self.removeItem(block_item)
+            self.m_block_items[:] = kept_items
+            self.m_network.m_blocks[:] = [
+                b for b in self.m_network.m_blocks if id(b) not in to_remove
+            ]
+            self.m_network.invalidate_resolved_endpoints()
+        finally:
+            self.blockSignals(was_blocked)
+
+        # 恢复信号后统一发出一次 selectionChanged，场景管理器之外的监听者也能收到选中状态的变化；
+        # 调用方自身阻塞了信号时该信号不会送达，选中状态索引直接重新同步
+        if was_blocked:
+            self.update_selection_sets()
+        self.selectionChanged.emit()
 
     def remove_connector(self, con: Union[Connector, int]) -> None:
         """从网络中移除一个连接器。
@@ -708,25 +770,8 @@ class SceneManager(QGraphicsScene):
         # 获取待删除连接器
         con_to_remove = self.m_network.m_connectors[connector_index]
 
-        # 删除关联图形项 (修正循环逻辑)
-        i = 0
-        while i < len(self.m_connector_segment_items):
-            if (
-                self.m_connector_segment_items[i].m_connector is con_to_remove
-            ):  # 关键修正点2
-                item = self.m_connector_segment_items.pop(i)
-                self.removeItem(item)
-                del item
-            else:
-                i += 1  # 仅当不删除时递增索引
-
-        # 清理块-连接器映射表 (完整实现)
-        for block in list(self.m_block_connector_map.keys()):  # 遍历副本避免修改问题
-            cons = self.m_block_connector_map[block]
-            if con_to_remove in cons:
-                cons.remove(con_to_remove)
-                if not cons:  # 清理空集合
-                    del self.m_block_connector_map[block]
+        # 删除关联图形项并清理映射表
+        self._remove_connectors_items((con_to_remove,))
 
         # 删除连接器数据
         del self.m_network.m_connectors[connector_index]
@@ -754,31 +799,46 @@ class SceneManager(QGraphicsScene):
     def mouseMoveEvent(self, mouse_event) -> None:
         """处理鼠标移动事件。
 
-        如果当前正在连接中，检查是否有可用的目标插槽。
+        如果当前正在连接中，延迟检查是否有可用的目标插槽，
+        高频的鼠标移动事件会被合并为每个定时周期一次检查。
 
         Args:
             mouse_event: 鼠标事件对象。
         """
-        if self.m_currently_connecting:
-            if (
-                self.m_block_items.__len__() > 0
-                and self.m_block_items[-1].block.m_name == Globals.InvisibleLabel
-            ):
-                p = self.m_block_items[-1].pos()
-                for bi in self.m_block_items:
-                    if bi.block.m_name == Globals.InvisibleLabel:
-                        continue
-                    # 重置所有插槽状态
-                    for si in bi.m_socket_items:
-                        si.m_hovered = False
-                        si.update()
-
-                    socket_item = bi.inlet_socket_accepting_connection(p)
-                    if socket_item is not None:
-                        if not self.is_connected_socket(bi.block, socket_item.socket):
-                            socket_item.m_hovered = True
-                            socket_item.update()
-        super().mouseMoveEvent(mouse_event)
+        if self.m_currently_connecting and not self.m_hover_timer.isActive():
+            self.m_hover_timer.start()
+        # 同时拖动多个块时，每个块都会触发 block_moved，这里只发出一次几何变化信号
+        with self.deferred_geometry_changes():
+            super().mouseMoveEvent(mouse_event)
+
+    def update_connection_hover(self) -> None:
+        """更新连接过程中目标插槽的悬停状态。
+
+        以虚拟块的当前位置进行插槽命中测试，由 m_hover_timer 触发。
+        """
+        if not self.m_currently_connecting:
+            return
+        if (
+            self.m_block_items.__len__() > 0
+            and self.m_block_items[-1].block.m_name == Globals.InvisibleLabel
+        ):
+            p = self.m_block_items[-1].pos()
+            # 仅对光标附近的块进行插槽命中测试
+            hovered_sockets: Set[SocketItem] = set()
+            for bi in self._block_items_near(p):
+                socket_item = bi.inlet_socket_accepting_connection(p)
+                if socket_item is not None:
+                    if not self.is_connected_socket(bi.block, socket_item.socket):
+                        hovered_sockets.add(socket_item)
+
+            # 只更新离开或进入悬停状态的插槽
+            for si in self.m_hovered_sockets - hovered_sockets:
+                si.m_hovered = False
+                si.update()
+            for si in hovered_sockets - self.m_hovered_sockets:
+                si.m_hovered = True
+                si.update()
+            self.m_hovered_sockets = hovered_sockets
 
     def mouseReleaseEvent(self, mouse_event: QGraphicsSceneMouseEvent) -> None:
         """处理鼠标释放事件。
@@ -800,16 +860,15 @@ class SceneManager(QGraphicsScene):
                     and self.m_block_items[-1].block.m_name == Globals.InvisibleLabel
                 ):
                     p = self.m_block_items[-1].pos()
-                    for bi in self.m_block_items:
-                        if bi.block.m_name == Globals.InvisibleLabel:
-                            continue
-
+                    for bi in self._block_items_near(p):
                         # 查找可以连接的插槽
                         si = bi.inlet_socket_accepting_connection(p)
                         if si and not self.is_connected_socket(bi.block, si.socket):
                             # 找到目标插槽，记录起始插槽和目标插槽
                             start_socket = self.m_network.m_connectors[-1].m_source_socket
-                            target_socket = f"{bi.block.m_name}.{si.socket.m_name}"
+                            target_socket = sys.intern(
+                                f"{bi.block.m_name}.{si.socket.m_name}"
+                            )
                             break
 
             self.finish_connection()
@@ -828,18 +887,186 @@ class SceneManager(QGraphicsScene):
                 self.new_connection_added.emit()
             else:
                 # 如果没有选择任何块或连接器，发出清除选择的信号
-                block_or_connector_selected = False
-                for item in self.m_block_items:
-                    if item.isSelected():
-                        block_or_connector_selected = True
-                        break
-                for item in self.m_connector_segment_items:
-                    if item.isSelected():
-                        block_or_connector_selected = True
-                        break
-                if not block_or_connector_selected:
+                if not self.selectedItems():
                     self.selection_cleared.emit()
 
+    def _add_block_item(self, item: BlockItem) -> None:
+        """将块图形项添加到场景，并更新块列表和名称索引。
+
+        Args:
+            item: 需要添加的块图形项。
+        """
+        self.addItem(item)
+        self.m_block_items.append(item)
+        self.m_block_item_by_name[item.m_block.m_name] = item
+
+    def _block_items_near(self, scene_pos: QPointF) -> List[BlockItem]:
+        """借助场景空间索引查找指定场景坐标附近的块图形项。
+
+        查询范围为插槽命中半径，命中的插槽图形项会映射到其所属的块图形项。
+
+        Args:
+            scene_pos: 场景坐标。
+
+        Returns:
+            候选块图形项列表，不包含用于连接的隐藏块。
+        """
+        r = Globals.GridSpacing / 2
+        rect = QRectF(scene_pos - QPointF(r, r), QSizeF(2 * r, 2 * r))
+        block_items: List[BlockItem] = []
+        for item in self.items(rect, Qt.IntersectsItemBoundingRect, Qt.AscendingOrder):
+            if isinstance(item, SocketItem):
+                item = item.parentItem()
+            if (
+                isinstance(item, BlockItem)
+                and not item.is_invisible()
+                and item not in block_items
+            ):
+                block_items.append(item)
+        return block_items
+
+    def _add_connector_segment_items(
+        self, items: Iterable[ConnectorSegmentItem]
+    ) -> None:
+        """将连接器线段图形项添加到场景，并更新线段列表和连接器索引。
+
+        Args:
+            items: 需要添加的线段图形项。
+        """
+        for item in items:
+            self.addItem(item)
+            self.m_connector_segment_items[id(item)] = item
+            self.m_segment_items_by_connector.setdefault(item.m_connector, []).append(
+                item
+            )
+
+    def _connector_item(self, con: Connector) -> ConnectorItem:
+        """获取连接器的绘制图形项，不存在时创建并添加到场景。
+
+        Args:
+            con: 连接器对象。
+
+        Returns:
+            连接器的绘制图形项。
+        """
+        connector_item = self.m_connector_items.get(con)
+        if connector_item is None:
+            connector_item = ConnectorItem(con)
+            self.addItem(connector_item)
+            self.m_connector_items[con] = connector_item
+        return connector_item
+
+    def _register_connector_block(
+        self, con: Connector, block: Block, socket: Socket
+    ) -> None:
+        """登记连接器与块及插槽的关联（同时更新正向和反向映射）。
+
+        Args:
+            con: 连接器对象。
+            block: 与连接器相连的块对象。
+            socket: 与连接器相连的插槽对象。
+        """
+        self.m_block_connector_map.setdefault(block, set()).add(con)
+        self.m_connector_block_map.setdefault(con, set()).add(block)
+        key = (id(block), id(socket))
+        keys = self.m_connector_socket_keys.setdefault(con, {})
+        if key not in keys:
+            keys[key] = (block, socket)
+            count = self.m_connected_sockets.get(key, 0)
+            self.m_connected_sockets[key] = count + 1
+            if count == 0:
+                self._update_socket_item(block, socket)
+
+    def _register_connector_blocks(self, con: Connector) -> None:
+        """解析连接器的源块和目标块，并登记关联。
+
+        Args:
+            con: 需要登记的连接器对象。插槽名称无效时不做登记。
+        """
+        try:
+            source_block, source_socket, target_block, target_socket = (
+                self.m_network.resolve_connector(con)
+            )
+        except RuntimeError:
+            return
+        self._register_connector_block(con, source_block, source_socket)
+        self._register_connector_block(con, target_block, target_socket)
+
+    def _unregister_connector(self, con: Connector) -> None:
+        """移除连接器与所有块及插槽的关联。
+
+        Args:
+            con: 需要移除关联的连接器对象。
+        """
+        for key, (block, socket) in self.m_connector_socket_keys.pop(con, {}).items():
+            count = self.m_connected_sockets.get(key, 0) - 1
+            if count > 0:
+                self.m_connected_sockets[key] = count
+            else:
+                self.m_connected_sockets.pop(key, None)
+                self._update_socket_item(block, socket)
+        for block in self.m_connector_block_map.pop(con, ()):
+            cons = self.m_block_connector_map.get(block)
+            if cons is not None:
+                cons.discard(con)
+                if not cons:  # 清理空集合
+                    del self.m_block_connector_map[block]
+
+    def _update_socket_item(self, block: Block, socket: Socket) -> None:
+        """请求重绘指定插槽的图形项（插槽的连接状态发生变化时调用）。
+
+        Args:
+            block: 插槽所属的块对象。
+            socket: 插槽对象。
+        """
+        block_item = self.m_block_item_by_name.get(block.m_name)
+        if block_item is None or block_item.m_block is not block:
+            # 块可能在建立索引后被重命名，回退到线性查找并修正索引
+            block_item = next(
+                (item for item in self.m_block_items if item.m_block is block), None
+            )
+            if block_item is None:
+                return
+            self.m_block_item_by_name[block.m_name] = block_item
+        for socket_item in block_item.m_socket_items:
+            if socket_item.m_socket is socket:
+                socket_item.update()
+                break
+
+    def _remove_connectors_items(self, cons: Iterable[Connector]) -> None:
+        """移除若干连接器的全部线段图形项，并清理相关索引和映射。
+
+        Args:
+            cons: 需要移除图形项的连接器对象。
+        """
+        removed_items: Set[ConnectorSegmentItem] = set()
+        for con in cons:
+            removed_items.update(self.m_segment_items_by_connector.pop(con, ()))
+            self._unregister_connector(con)
+            self.m_connector_geometry.pop(con, None)
+            self.m_network.invalidate_resolved_connector(con)
+            connector_item = self.m_connector_items.pop(con, None)
+            if connector_item is not None:
+                self.removeItem(connector_item)
+
+        for item in removed_items:
+            self.m_connector_segment_items.pop(id(item), None)
+            self.removeItem(item)
+
+    def _remove_connector_segment_item(self, item: ConnectorSegmentItem) -> None:
+        """从场景中移除连接器线段图形项，并更新线段列表和连接器索引。
+
+        Args:
+            item: 需要移除的线段图形项。
+        """
+        self.m_connector_segment_items.pop(id(item), None)
+        con_items = self.m_segment_items_by_connector.get(item.m_connector)
+        if con_items is not None and item in con_items:
+            con_items.remove(item)
+            if not con_items:
+                del self.m_segment_items_by_connector[item.m_connector]
+        self.removeItem(item)
+
     def create_block_item(self, block: Block) -> BlockItem:
         """创建一个块图形项。
 
@@ -886,42 +1113,44 @@ class SceneManager(QGraphicsScene):
                 con.m_source_socket
             )
             if source_block and source_socket:
-                self.m_block_connector_map.setdefault(source_block, set()).add(con)
+                self._register_connector_block(con, source_block, source_socket)
                 start_line = source_block.socket_start_line(source_socket)
 
             target_block, target_socket = self.m_network.lookup_block_and_socket(
                 con.m_target_socket
             )
             if target_block and target_socket:
-                self.m_block_connector_map.setdefault(target_block, set()).add(con)
+                self._register_connector_block(con, target_block, target_socket)
                 end_line = target_block.socket_start_line(target_socket)  # 覆盖默认值
 
             # 创建起始和结束线段
             item = self.create_connector_item(con)
             item.setLine(start_line)
-            item.setFlags(QGraphicsItem.ItemIsSelectable)
+            item.setFlags(
+                QGraphicsItem.ItemIsSelectable | QGraphicsItem.ItemHasNoContents
+            )
             item.m_segment_idx = -1  # 起始线段
             new_conns.append(item)
 
             item = self.create_connector_item(con)
             item.setLine(end_line)
-            item.setFlags(QGraphicsItem.ItemIsSelectable)
+            item.setFlags(
+                QGraphicsItem.ItemIsSelectable | QGraphicsItem.ItemHasNoContents
+            )
             item.m_segment_idx = -2  # 结束线段
             new_conns.append(item)
 
             # 创建中间线段
-            start = start_line.p2()
-            for i, seg in enumerate(con.m_segments):
+            sx, sy = start_line.x2(), start_line.y2()
+            end_points = self._segment_end_points(sx, sy, con.route_template())
+            for i, (nx, ny) in enumerate(end_points):
                 item = self.create_connector_item(con)
-                next_point = (
-                    start + QPointF(seg.m_offset, 0)
-                    if seg.m_direction == Qt.Horizontal
-                    else start + QPointF(0, seg.m_offset)
-                )
-                item.setLine(QLineF(start, next_point))
+                item.setLine(sx, sy, nx, ny)
                 item.m_segment_idx = i  # 中间线段
                 new_conns.append(item)
-                start = next_point
+                sx, sy = nx, ny
+
+            self._connector_item(con).set_geometry(start_line, end_points, end_line)
 
         except Exception as e:
             print(f"创建连接器图形项时出错: {e}")
@@ -931,6 +1160,27 @@ class SceneManager(QGraphicsScene):
 
         return new_conns
 
+    @staticmethod
+    def _segment_end_points(
+        x: float, y: float, template: RouteTemplate
+    ) -> List[Tuple[float, float]]:
+        """计算连接器中间线段的终点坐标。
+
+        纯数值计算，不涉及任何 Qt 对象，线段图形项的更新循环只需调用 setLine()。
+        相对坐标的前缀和已由共享的路由模板预先算好，这里只需平移到起点。
+
+        Args:
+            x: 第一个中间线段起点的 X 坐标。
+            y: 第一个中间线段起点的 Y 坐标。
+            template: 连接器的路由模板。
+
+        Returns:
+            每个中间线段终点的 (x, y) 坐标列表。
+        """
+        return [
+            (x + rx, y + ry) for rx, ry in zip(template.m_end_xs, template.m_end_ys)
+        ]
+
     def on_selection_changed(self) -> None:
         """处理选择变化事件。
 
@@ -950,8 +1200,8 @@ class SceneManager(QGraphicsScene):
         # 如果选中了连接器，选中该连接器的所有线段
         if selected_connectors:
             self.clearSelection()
-            for item in self.m_connector_segment_items:
-                if item.m_connector in selected_connectors:
+            for con in selected_connectors:
+                for item in self.m_segment_items_by_connector.get(con, ()):
                     item.setSelected(True)
             # 发出信号，表示选中了连接器
             # self.new_connector_selected.emit(
@@ -978,45 +1228,63 @@ class SceneManager(QGraphicsScene):
             con: 需要更新的连接器对象。
             current_item: 当前正在操作的线段图形项。
         """
+        # 分别查找源插槽和目标插槽，计算起止线段
+        try:
+            start_line, end_line = self._connector_end_lines(con)
+        except Exception as e:
+            print(f"更新连接器线段时出错: {e}")
+            return
+
+        # 路由模板与起止线段均未变化，且没有正在拖动的线段时，图形项已是最新状态
+        geometry_key = (
+            con.route_template(),
+            start_line.x1(),
+            start_line.y1(),
+            start_line.x2(),
+            start_line.y2(),
+            end_line.x1(),
+            end_line.y1(),
+            end_line.x2(),
+            end_line.y2(),
+        )
+        if current_item is None and self.m_connector_geometry.get(con) == geometry_key:
+            return
+
         start_segment: Optional[ConnectorSegmentItem] = None
         end_segment: Optional[ConnectorSegmentItem] = None
         segment_items: List[ConnectorSegmentItem] = []
 
-        # 查找所有与连接器相关的线段图形项
-        for item in self.m_connector_segment_items:
-            if item.m_connector == con:
-                if item.m_segment_idx == -1:
-                    start_segment = item
-                elif item.m_segment_idx == -2:
-                    end_segment = item
-                else:
-                    if current_item is None or item != current_item:
-                        segment_items.append(item)
+        # 通过连接器索引获取与连接器相关的线段图形项
+        for item in self.m_segment_items_by_connector.get(con, ()):
+            if item.m_segment_idx == -1:
+                start_segment = item
+            elif item.m_segment_idx == -2:
+                end_segment = item
+            else:
+                if current_item is None or item != current_item:
+                    segment_items.append(item)
 
         # 如果找不到任何线段图形项，重新创建
         if start_segment is None and end_segment is None and not segment_items:
-            new_conns = self.create_connector_items(con)
-            for item in new_conns:
-                self.addItem(item)
-                self.m_connector_segment_items.append(item)
+            self._add_connector_segment_items(self.create_connector_items(con))
             return
 
         # 确保起始和结束线段存在
         assert start_segment is not None
         assert end_segment is not None
 
+        # 路由模板已在计算几何键时取得，直接复用
+        template = geometry_key[0]
+        segment_count = len(template.m_segments)
+
         # 移除多余的线段图形项
-        items_needed = len(con.m_segments)
+        items_needed = segment_count
         if current_item is not None:
             items_needed -= 1
 
         while len(segment_items) > items_needed:
-            item = segment_items[-1]
-            if item in self.m_connector_segment_items:
-                self.m_connector_segment_items.remove(item)
-            # del item
-            self.removeItem(item)
-            segment_items.pop()
+            item = segment_items.pop()
+            self._remove_connector_segment_item(item)
 
         # 【高亮逻辑】
         # 添加缺失的线段图形项
@@ -1025,60 +1293,81 @@ class SceneManager(QGraphicsScene):
             item.m_is_highlighted = (
                 current_item.m_is_highlighted if current_item else False
             )
-            self.addItem(item)
-            self.m_connector_segment_items.append(item)
+            self._add_connector_segment_items((item,))
             segment_items.append(item)
 
-        # 插入当前线段图形项
+        # 将当前线段图形项放入其索引位置，其余图形项按原顺序填入前后空位
         if current_item is not None:
-            segment_items.insert(current_item.m_segment_idx, current_item)
+            current_idx = current_item.m_segment_idx
+            ordered_items: List[Optional[ConnectorSegmentItem]] = [None] * (
+                items_needed + 1
+            )
+            ordered_items[:current_idx] = segment_items[:current_idx]
+            ordered_items[current_idx] = current_item
+            ordered_items[current_idx + 1 :] = segment_items[current_idx:]
+            segment_items = ordered_items
 
         # 确保线段图形项数量与线段数量一致
-        assert len(segment_items) == len(con.m_segments)
+        assert len(segment_items) == segment_count
 
         # 更新所有线段图形项的几何信息
         try:
-            # 分别查找源插槽和目标插槽
-            source_block, source_socket = self.m_network.lookup_block_and_socket(
-                con.m_source_socket
-            )
-            target_block, target_socket = self.m_network.lookup_block_and_socket(
-                con.m_target_socket
-            )
+            # 先按场景坐标重建连接器的绘制路径
+            connector_item = self._connector_item(con)
+            scene_start_line = QLineF(start_line)
+            scene_end_line = QLineF(end_line)
 
             # 更新起始线段（源插槽）
-            if source_block and source_socket:
-                start_line = source_block.socket_start_line(source_socket)
-                pos = start_segment.pos()
-                start_line.translate(-pos)
-                start_segment.setLine(start_line)
-            else:
-                raise ValueError("源插槽未找到或无效。")
+            pos = start_segment.pos()
+            start_line.translate(-pos)
+            start_segment.setLine(start_line)
 
             # 更新结束线段（目标插槽）
-            if target_block and target_socket:
-                end_line = target_block.socket_start_line(target_socket)
-                pos = end_segment.pos()
-                end_line.translate(-pos)
-                end_segment.setLine(end_line)
-            else:
-                raise ValueError("目标插槽未找到或无效。")
-
-            # 更新中间线段
-            start = start_line.p2()
-            for i, seg in enumerate(con.m_segments):
+            pos = end_segment.pos()
+            end_line.translate(-pos)
+            end_segment.setLine(end_line)
+
+            # 更新中间线段（直接使用坐标分量，避免创建中间 QPointF/QLineF 对象）
+            sx, sy = start_line.x2(), start_line.y2()
+            end_points = self._segment_end_points(sx, sy, template)
+            for i, (nx, ny) in enumerate(end_points):
                 item = segment_items[i]
-                next_point = (
-                    start + QPointF(seg.m_offset, 0)
-                    if seg.m_direction == Qt.Horizontal
-                    else start + QPointF(0, seg.m_offset)
-                )
-                new_line = QLineF(start, next_point)
                 pos = item.pos()
-                new_line.translate(-pos)
-                item.set_line(new_line)
+                px, py = pos.x(), pos.y()
+                item.set_line(sx - px, sy - py, nx - px, ny - py)
                 item.m_segment_idx = i
-                start = next_point
+                sx, sy = nx, ny
+
+            # 中间线段终点相对于起始线段图形项，换算回场景坐标
+            pos = start_segment.pos()
+            ox, oy = pos.x(), pos.y()
+            connector_item.set_geometry(
+                scene_start_line,
+                [(x + ox, y + oy) for x, y in end_points],
+                scene_end_line,
+            )
+
+            self.m_connector_geometry[con] = geometry_key
 
         except Exception as e:
             print(f"更新连接器线段时出错: {e}")
+
+    def _connector_end_lines(self, con: Connector) -> Tuple[QLineF, QLineF]:
+        """计算连接器在源插槽和目标插槽处的起止线段（场景坐标）。
+
+        Args:
+            con: 连接器对象。
+
+        Returns:
+            (起始线段, 结束线段) 元组。
+
+        Raises:
+            RuntimeError: 如果源插槽或目标插槽无效。
+        """
+        source_block, source_socket, target_block, target_socket = (
+            self.m_network.resolve_connector(con)
+        )
+        return (
+            source_block.socket_start_line(source_socket),
+            target_block.socket_start_line(target_socket),
+        )
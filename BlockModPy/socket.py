@@ -34,7 +34,12 @@
 #  OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from __future__ import annotations
+
+import sys
 from enum import Enum
+from typing import List, Optional, Tuple
+from xml.etree.ElementTree import Element
 
 from qtpy.QtCore import Qt, QXmlStreamReader, QXmlStreamWriter, QPointF
 
@@ -51,6 +56,10 @@ class Socket:
         m_inlet: 连接点类型标识。
             True  - 输入型插槽（接收连接线接入）
             False - 输出型插槽（发起连接线）
+
+    Note:
+        m_pos 和 m_orientation 为属性，赋值时会重新计算插槽方向；
+        不要原地修改 m_pos（如 m_pos.setX()），应整体赋值新的 QPointF。
     """
 
     class Direction(Enum):
@@ -68,13 +77,44 @@ class Socket:
         Top = 2
         Bottom = 3
 
+    __slots__ = ("m_name", "_m_pos", "_m_orientation", "m_inlet", "_m_direction")
+
     def __init__(self) -> None:
         self.m_name: str = ""  # 插槽名称
-        self.m_pos: QPointF = QPointF(0, 0)  # 插槽位置
-        self.m_orientation: Qt.Orientation = Qt.Horizontal  # 插槽方向
+        self._m_pos: QPointF = QPointF(0, 0)  # 插槽位置
+        self._m_orientation: Qt.Orientation = Qt.Horizontal  # 插槽方向
+        self._m_direction: Socket.Direction = self._compute_direction()  # 插槽指向
         self.m_inlet: bool = False  # 是否为输入插槽
 
+    @property
+    def m_pos(self) -> QPointF:
+        return self._m_pos
+
+    @m_pos.setter
+    def m_pos(self, pos: QPointF) -> None:
+        self._m_pos = pos
+        self._m_direction = self._compute_direction()
+
+    @property
+    def m_orientation(self) -> Qt.Orientation:
+        return self._m_orientation
+
+    @m_orientation.setter
+    def m_orientation(self, orientation: Qt.Orientation) -> None:
+        self._m_orientation = orientation
+        self._m_direction = self._compute_direction()
+
     def direction(self) -> Direction:
+        """获取插槽指向方向。
+
+        方向在 m_pos 或 m_orientation 被赋值时即已算好，这里只返回保存的结果。
+
+        Returns:
+            插槽的方向枚举值。
+        """
+        return self._m_direction
+
+    def _compute_direction(self) -> Direction:
         """根据位置和方向计算插槽指向方向。
 
         水平方向时返回左侧边缘，否则右侧边缘；垂直方向时：y=0返回顶部边缘，否则底部边缘。
@@ -82,15 +122,15 @@ class Socket:
         Returns:
             返回计算得到的方向枚举值。
         """
-        if self.m_orientation == Qt.Horizontal:
+        if self._m_orientation == Qt.Horizontal:
             # 水平方向：左边缘为Left，右边缘为Right
             return (
-                self.Direction.Left if (self.m_pos.x() == 0) else self.Direction.Right
+                self.Direction.Left if (self._m_pos.x() == 0) else self.Direction.Right
             )
         else:
             # 垂直方向：上边缘为Top，下边缘为Bottom
             return (
-                self.Direction.Top if (self.m_pos.y() == 0) else self.Direction.Bottom
+                self.Direction.Top if (self._m_pos.y() == 0) else self.Direction.Bottom
             )
 
     def __eq__(self, other: object) -> bool:
@@ -120,6 +160,14 @@ class Socket:
             return self.m_name == other.m_name
         return NotImplemented
 
+    def __hash__(self) -> int:
+        """与 __eq__ 保持一致，按插槽名称计算哈希值。
+
+        Note:
+            插槽放入集合或作为字典键期间不应修改其名称。
+        """
+        return hash(self.m_name)
+
     def read_xml(self, reader: QXmlStreamReader) -> None:
         """从 XML 读取插槽数据。
 
@@ -133,12 +181,12 @@ class Socket:
             raise RuntimeError("Expected start element for Socket.")
 
         # 读取插槽属性
-        self.m_name = str(reader.attributes().value("name"))
+        self.m_name = sys.intern(str(reader.attributes().value("name")))
 
         while not reader.atEnd() and not reader.hasError():
             reader.readNext()
             if reader.isStartElement():
-                element_name = str(reader.name())
+                element_name = reader.name()
                 if element_name == "Position":
                     pos_str = self._read_text_element(reader)
                     self.m_pos = self._decode_point(pos_str)
@@ -164,6 +212,47 @@ class Socket:
         if reader.hasError():
             raise RuntimeError(reader.errorString())
 
+    def read_xml_element(
+        self,
+        elem: Element,
+        pending_positions: Optional[List[Tuple[Socket, str]]] = None,
+    ) -> None:
+        """从已解析的 XML 元素读取插槽数据。
+
+        Args:
+            elem: Socket 元素。
+            pending_positions: 若提供，位置文本不立即解码，而是以 (插槽, 文本)
+                追加到该列表，由 decode_socket_positions 统一批量解码。
+
+        Raises:
+            RuntimeError: 如果包含未知元素。
+            ValueError: 如果方向或入口标识的取值无效。
+        """
+        self.m_name = sys.intern(elem.get("name", ""))
+
+        for child in elem:
+            element_name = child.tag
+            text = child.text or ""
+            if element_name == "Position":
+                if pending_positions is None:
+                    self.m_pos = self._decode_point(text)
+                else:
+                    pending_positions.append((self, text))
+            elif element_name == "Orientation":
+                if text not in ["Horizontal", "Vertical"]:
+                    raise ValueError(f"Invalid orientation value: {text}")
+                self.m_orientation = (
+                    Qt.Horizontal if text == "Horizontal" else Qt.Vertical
+                )
+            elif element_name == "Inlet":
+                if text not in ["true", "false"]:
+                    raise ValueError(f"Invalid inlet value: {text}")
+                self.m_inlet = text == "true"
+            else:
+                raise RuntimeError(
+                    f"Found unknown element '{element_name}' in Socket tag."
+                )
+
     def write_xml(self, writer: QXmlStreamWriter) -> None:
         """将插槽数据写入 XML。
 
@@ -209,7 +298,7 @@ class Socket:
         Returns:
             编码后的字符串，格式为 "x,y"。
         """
-        return f"{point.x()},{point.y()}"
+        return str(point.x()) + "," + str(point.y())
 
     def _decode_point(self, point_str: str) -> QPointF:
         """将字符串解码为 QPointF。
@@ -224,7 +313,59 @@ class Socket:
             RuntimeError: 如果字符串格式无效。
         """
         try:
-            x, y = map(float, point_str.split(","))
-            return QPointF(x, y)
+            i = point_str.index(",")
+            return QPointF(float(point_str[:i]), float(point_str[i + 1 :]))
         except ValueError:
             raise RuntimeError(f"Invalid point format: {point_str}")
+
+
+def parse_socket_from_element(
+    elem: Element, pending_positions: Optional[List[Tuple[Socket, str]]] = None
+) -> Socket:
+    """根据已解析的 Socket 元素创建插槽对象。
+
+    Args:
+        elem: Socket 元素。
+        pending_positions: 延迟解码的位置列表，参见 Socket.read_xml_element。
+
+    Returns:
+        新建的插槽对象。
+    """
+    socket = Socket()
+    socket.read_xml_element(elem, pending_positions)
+    return socket
+
+
+# 少于该数量的位置文本逐个解码，批量拼接的开销不划算
+_BATCH_DECODE_MIN_COUNT = 16
+
+
+def decode_socket_positions(pending_positions: List[Tuple[Socket, str]]) -> None:
+    """批量解码延迟的插槽位置文本并赋值给对应插槽。
+
+    所有 "x,y" 文本拼接后一次性拆分，由 map(float, ...) 在 C 层完成全部数值转换。
+    任一文本格式无效时退回逐个解码，以给出指明该文本的错误信息。
+
+    Args:
+        pending_positions: (插槽, 位置文本) 列表。
+
+    Raises:
+        RuntimeError: 如果位置文本格式无效。
+    """
+    if len(pending_positions) >= _BATCH_DECODE_MIN_COUNT:
+        texts = [text for _, text in pending_positions]
+        # 每个文本恰好包含一个逗号时，拆分结果才能按 (x, y) 成对对齐
+        if all(text.count(",") == 1 for text in texts):
+            try:
+                values = list(map(float, ",".join(texts).split(",")))
+            except ValueError:
+                pass
+            else:
+                xs = values[0::2]
+                ys = values[1::2]
+                for (socket, _), x, y in zip(pending_positions, xs, ys):
+                    socket.m_pos = QPointF(x, y)
+                return
+
+    for socket, text in pending_positions:
+        socket.m_pos = socket._decode_point(text)
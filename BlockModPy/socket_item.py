@@ -36,7 +36,8 @@
 
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .block_item import BlockItem
@@ -61,13 +62,52 @@ from qtpy.QtWidgets import (
 )
 
 from .block import Block
-from .globals import Globals
+from .globals import Globals, scene_manager_class
 from .socket import Socket
 
+# 插槽符号矩形的构造表：(是否为入口插槽, 插槽方向) -> (px, py) -> QRectF
+_SYMBOL_RECT_BUILDERS = {
+    (True, Socket.Direction.Left): lambda px, py: QRectF(-4, py - 4, 8, 8),
+    (True, Socket.Direction.Right): lambda px, py: QRectF(px - 4, py - 4, 8, 8),
+    (True, Socket.Direction.Top): lambda px, py: QRectF(px - 4, -4, 8, 8),
+    (True, Socket.Direction.Bottom): lambda px, py: QRectF(px - 4, py - 4, 8, 8),
+    (False, Socket.Direction.Left): lambda px, py: QRectF(-8, py - 4, 8, 8),
+    (False, Socket.Direction.Right): lambda px, py: QRectF(px, py - 4, 8, 8),
+    (False, Socket.Direction.Top): lambda px, py: QRectF(px - 4, -8, 8, 8),
+    (False, Socket.Direction.Bottom): lambda px, py: QRectF(px - 4, py, 8, 8),
+}
+
+# 输入插槽半圆的弧线参数：插槽方向 -> (起始角, 跨度)，单位为 1/16 度
+_INLET_ARC_ARGS = {
+    Socket.Direction.Left: (90 * 16, -180 * 16),
+    Socket.Direction.Right: (90 * 16, 180 * 16),
+    Socket.Direction.Top: (0 * 16, -180 * 16),
+    Socket.Direction.Bottom: (0 * 16, 180 * 16),
+}
+
+
+@lru_cache(maxsize=2048)
+def _text_rect(font_size: float, name: str) -> Tuple[float, float, float, float]:
+    """计算插槽名称标签的文本边界矩形，按 (字号, 名称) 缓存。
+
+    Args:
+        font_size: 标签字号。
+        name: 插槽名称。
+
+    Returns:
+        (x, y, 宽, 高) 元组，宽度已包含 6 像素留白。
+    """
+    _, metrics = SocketItem._get_font_metrics(font_size)
+    rect = metrics.boundingRect(name)
+    return rect.x(), rect.y(), rect.width() + 6, rect.height()
+
 
 class SocketItem(QGraphicsItem):
     """SocketItem 类，表示图形场景中的插槽项，负责绘制插槽并处理相关事件。"""
 
+    # 标签字体缓存：字号 -> (字体, 字体度量)
+    _font_cache: Dict[float, Tuple[QFont, QFontMetrics]] = {}
+
     def __init__(self, parent: BlockItem, socket: Socket) -> None:
         """初始化 SocketItem 对象。
 
@@ -80,67 +120,139 @@ class SocketItem(QGraphicsItem):
         self.m_socket: Socket = socket
         self.m_hovered: bool = False
         self.m_symbol_rect: QRectF = QRectF()
+        # 由 update_socket_item 预先计算：输入插槽的弧线参数 (起始角, 跨度)，输出插槽的三角形路径
+        self.m_cached_arc_args: Optional[Tuple[int, int]] = None
+        self.m_cached_path: Optional[QPainterPath] = None
+        # 已连接标记（内圆）和悬停标记所用的矩形
+        self.m_inner_rect: QRectF = QRectF()
+        self.m_hover_rect: QRectF = QRectF()
+        # 包含插槽符号、悬停标记和名称标签的边界矩形
+        self.m_bounding_rect: QRectF = QRectF()
 
         self.update_socket_item()
         self.setZValue(12)
         self.setAcceptHoverEvents(True)
+        # 插槽外观只在位置、悬停或连接状态变化时改变，缓存其光栅化结果
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     @property
     def socket(self) -> Socket:
         return self.m_socket
 
+    @classmethod
+    def _get_font_metrics(
+        cls, font_size: Optional[float] = None
+    ) -> Tuple[QFont, QFontMetrics]:
+        """获取标签字体及其度量，按字号缓存。
+
+        Args:
+            font_size: 字号，默认为当前的 Globals.LabelFontSize。
+
+        Returns:
+            (字体, 字体度量) 元组。
+        """
+        if font_size is None:
+            font_size = Globals.LabelFontSize
+        cached = cls._font_cache.get(font_size)
+        if cached is None:
+            font = QFont()
+            font.setPointSizeF(font_size)
+            cached = (font, QFontMetrics(font))
+            cls._font_cache[font_size] = cached
+        return cached
+
+    @staticmethod
+    def _text_bounding_rect(name: str) -> QRectF:
+        """获取插槽名称标签的文本边界矩形。
+
+        Args:
+            name: 插槽名称。
+
+        Returns:
+            新建的文本边界矩形，调用方可自由修改。
+        """
+        return QRectF(*_text_rect(Globals.LabelFontSize, name))
+
     def update_socket_item(self) -> None:
         """更新插槽项的位置和大小。"""
+        pos = self.m_socket.m_pos
+        build_rect = _SYMBOL_RECT_BUILDERS[
+            (self.m_socket.m_inlet, self.m_socket.direction())
+        ]
+        self.prepareGeometryChange()
+        self.m_symbol_rect = build_rect(pos.x(), pos.y())
+        self.m_inner_rect = self.m_symbol_rect.adjusted(2, 2, -2, -2)
+        self.m_hover_rect = self.m_symbol_rect.adjusted(-1, -1, 1, 1)
+        self.m_bounding_rect = self.m_symbol_rect.adjusted(-2, -2, 2, 2).united(
+            self._label_rect()
+        )
+
         if self.m_socket.m_inlet:
-            if self.m_socket.direction() == Socket.Direction.Left:
-                self.m_symbol_rect = QRectF(-4, self.m_socket.m_pos.y() - 4, 8, 8)
-            elif self.m_socket.direction() == Socket.Direction.Right:
-                self.m_symbol_rect = QRectF(
-                    self.m_socket.m_pos.x() - 4, self.m_socket.m_pos.y() - 4, 8, 8
-                )
-            elif self.m_socket.direction() == Socket.Direction.Top:
-                self.m_symbol_rect = QRectF(self.m_socket.m_pos.x() - 4, -4, 8, 8)
-            elif self.m_socket.direction() == Socket.Direction.Bottom:
-                self.m_symbol_rect = QRectF(
-                    self.m_socket.m_pos.x() - 4, self.m_socket.m_pos.y() - 4, 8, 8
-                )
+            self.m_cached_arc_args = _INLET_ARC_ARGS.get(self.m_socket.direction())
+            self.m_cached_path = None
         else:
-            if self.m_socket.direction() == Socket.Direction.Left:
-                self.m_symbol_rect = QRectF(-8, self.m_socket.m_pos.y() - 4, 8, 8)
-            elif self.m_socket.direction() == Socket.Direction.Right:
-                self.m_symbol_rect = QRectF(
-                    self.m_socket.m_pos.x(), self.m_socket.m_pos.y() - 4, 8, 8
-                )
-            elif self.m_socket.direction() == Socket.Direction.Top:
-                self.m_symbol_rect = QRectF(self.m_socket.m_pos.x() - 4, -8, 8, 8)
-            elif self.m_socket.direction() == Socket.Direction.Bottom:
-                self.m_symbol_rect = QRectF(
-                    self.m_socket.m_pos.x() - 4, self.m_socket.m_pos.y(), 8, 8
-                )
+            d = self.m_socket.direction()
+            rect = self.m_symbol_rect
+            path = QPainterPath()
+            if d == Socket.Direction.Left:
+                path.moveTo(rect.right(), rect.y())
+                path.lineTo(rect.left(), 0.5 * (rect.top() + rect.bottom()))
+                path.lineTo(rect.right(), rect.bottom())
+            elif d == Socket.Direction.Right:
+                path.moveTo(rect.left(), rect.y())
+                path.lineTo(rect.right(), 0.5 * (rect.top() + rect.bottom()))
+                path.lineTo(rect.left(), rect.bottom())
+            elif d == Socket.Direction.Top:
+                path.moveTo(rect.left(), rect.bottom())
+                path.lineTo(0.5 * (rect.left() + rect.right()), rect.top())
+                path.lineTo(rect.right(), rect.bottom())
+            elif d == Socket.Direction.Bottom:
+                path.moveTo(rect.left(), rect.top())
+                path.lineTo(0.5 * (rect.left() + rect.right()), rect.bottom())
+                path.lineTo(rect.right(), rect.top())
+            self.m_cached_path = path
+            self.m_cached_arc_args = None
+
+    def _label_rect(self) -> QRectF:
+        """计算名称标签在本项坐标系中占据的矩形，与 paint 中的标签布局一致。
+
+        Returns:
+            名称标签的矩形。
+        """
+        rect = self.m_symbol_rect
+        text_rect = self._text_bounding_rect(self.m_socket.m_name)
+        w = text_rect.width()
+        h = text_rect.height()
+        d = self.m_socket.direction()
+        if d == Socket.Direction.Left:
+            return QRectF(rect.left() - w, rect.top() - h + 3, w, h)
+        elif d == Socket.Direction.Right:
+            return QRectF(rect.right(), rect.top() - h + 3, w, h)
+        elif d == Socket.Direction.Top:
+            # 标签逆时针旋转 90 度绘制
+            return QRectF(rect.left() - h, rect.top() - w, h, w)
+        else:
+            return QRectF(rect.left() - h, rect.bottom(), h, w)
 
     def boundingRect(self) -> QRectF:
         """获取插槽项的边界矩形。
 
+        边界矩形包含名称标签，以便设备坐标缓存能完整保存标签。
+
         Returns:
             插槽项的边界矩形。
         """
-        rect = self.m_symbol_rect
-        font = QFont()
-        font.setPointSizeF(Globals.LabelFontSize)
-        metrics = QFontMetrics(font)
-        text_bounding_rect = metrics.boundingRect(self.m_socket.m_name)
-        text_bounding_rect.setWidth(text_bounding_rect.width() + 6)
-
-        # if self.m_socket.direction() == Socket.Direction.Left:
-        #     rect.moveLeft(rect.left() - text_bounding_rect.width() - 6)
-        # elif self.m_socket.direction() == Socket.Direction.Right:
-        #     rect.setWidth(rect.width() + text_bounding_rect.width() + 6)
-        # elif self.m_socket.direction() == Socket.Direction.Top:
-        #     rect.moveTop(rect.top() - text_bounding_rect.width() - 6)
-        # elif self.m_socket.direction() == Socket.Direction.Bottom:
-        #     rect.setHeight(rect.height() + text_bounding_rect.width() + 6)
-
-        return rect
+        return self.m_bounding_rect
+
+    def shape(self) -> QPainterPath:
+        """获取插槽项的形状，仅包含插槽符号，标签不参与点击和悬停检测。
+
+        Returns:
+            插槽符号的形状路径。
+        """
+        path = QPainterPath()
+        path.addRect(self.m_symbol_rect)
+        return path
 
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
         """处理鼠标悬停进入事件。
@@ -156,8 +268,7 @@ class SocketItem(QGraphicsItem):
         Args:
             event: 鼠标悬停事件对象。
         """
-        from .scene_manager import SceneManager
-
+        SceneManager = scene_manager_class()
         scene_manager = self.scene()
         if isinstance(scene_manager, SceneManager):
             if (
@@ -170,6 +281,7 @@ class SocketItem(QGraphicsItem):
                 if QApplication.overrideCursor() is None:
                     QApplication.setOverrideCursor(Qt.CrossCursor)
                 self.m_hovered = True
+                self.update()
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event: QGraphicsSceneHoverEvent) -> None:
@@ -180,7 +292,8 @@ class SocketItem(QGraphicsItem):
         """
         if self.m_hovered:
             QApplication.restoreOverrideCursor()
-        self.m_hovered = False
+            self.m_hovered = False
+            self.update()
         super().hoverLeaveEvent(event)
 
     def paint(
@@ -205,73 +318,42 @@ class SocketItem(QGraphicsItem):
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, True)
         rect = self.m_symbol_rect
+        d = self.m_socket.direction()
 
         if self.m_socket.m_inlet:
             painter.setBrush(Qt.white)
-            if self.m_socket.direction() == Socket.Direction.Left:
-                painter.setPen(Qt.white)
-                painter.drawPie(rect, 90 * 16, -180 * 16)
-                painter.setPen(Qt.black)
-                painter.drawArc(rect, 90 * 16, -180 * 16)
-            elif self.m_socket.direction() == Socket.Direction.Right:
-                painter.setPen(Qt.white)
-                painter.drawPie(rect, 90 * 16, 180 * 16)
-                painter.setPen(Qt.black)
-                painter.drawArc(rect, 90 * 16, 180 * 16)
-            elif self.m_socket.direction() == Socket.Direction.Top:
-                painter.setPen(Qt.white)
-                painter.drawPie(rect, 0 * 16, -180 * 16)
-                painter.setPen(Qt.black)
-                painter.drawArc(rect, 0 * 16, -180 * 16)
-            elif self.m_socket.direction() == Socket.Direction.Bottom:
+            arc_args = self.m_cached_arc_args
+            if arc_args is not None:
                 painter.setPen(Qt.white)
-                painter.drawPie(rect, 0 * 16, 180 * 16)
+                painter.drawPie(rect, *arc_args)
                 painter.setPen(Qt.black)
-                painter.drawArc(rect, 0 * 16, 180 * 16)
-
-            from .scene_manager import SceneManager
+                painter.drawArc(rect, *arc_args)
 
+            SceneManager = scene_manager_class()
             scene_manager = self.scene()
             if isinstance(
                 scene_manager, SceneManager
             ) and scene_manager.is_connected_socket(self.m_block, self.m_socket):
-                painter.save()
+                # 只改动了画笔和画刷，手动恢复即可，无需保存完整的绘制状态
+                old_pen = painter.pen()
+                old_brush = painter.brush()
                 painter.setPen(Qt.NoPen)
                 painter.setBrush(Qt.black)
-                rect2 = QRectF(
-                    rect.x() + 2, rect.y() + 2, rect.width() - 4, rect.height() - 4
-                )
-                painter.drawEllipse(rect2)
-                painter.restore()
+                painter.drawEllipse(self.m_inner_rect)
+                painter.setPen(old_pen)
+                painter.setBrush(old_brush)
 
             if self.m_hovered:
-                painter.save()
+                old_pen = painter.pen()
+                old_brush = painter.brush()
                 pen = QPen(QColor(192, 0, 0), 0.8)
                 painter.setPen(pen)
                 painter.setBrush(QBrush(QColor(96, 0, 0)))
-                rect2 = QRectF(
-                    rect.x() - 1, rect.y() - 1, rect.width() + 2, rect.height() + 2
-                )
-                painter.drawEllipse(rect2)
-                painter.restore()
+                painter.drawEllipse(self.m_hover_rect)
+                painter.setPen(old_pen)
+                painter.setBrush(old_brush)
         else:
-            path = QPainterPath()
-            if self.m_socket.direction() == Socket.Direction.Left:
-                path.moveTo(rect.right(), rect.y())
-                path.lineTo(rect.left(), 0.5 * (rect.top() + rect.bottom()))
-                path.lineTo(rect.right(), rect.bottom())
-            elif self.m_socket.direction() == Socket.Direction.Right:
-                path.moveTo(rect.left(), rect.y())
-                path.lineTo(rect.right(), 0.5 * (rect.top() + rect.bottom()))
-                path.lineTo(rect.left(), rect.bottom())
-            elif self.m_socket.direction() == Socket.Direction.Top:
-                path.moveTo(rect.left(), rect.bottom())
-                path.lineTo(0.5 * (rect.left() + rect.right()), rect.top())
-                path.lineTo(rect.right(), rect.bottom())
-            elif self.m_socket.direction() == Socket.Direction.Bottom:
-                path.moveTo(rect.left(), rect.top())
-                path.lineTo(0.5 * (rect.left() + rect.right()), rect.bottom())
-                path.lineTo(rect.right(), rect.top())
+            path = self.m_cached_path
 
             pen = QPen(Qt.black)
             pen.setCapStyle(Qt.RoundCap)
@@ -282,14 +364,11 @@ class SocketItem(QGraphicsItem):
                 painter.setBrush(QColor(0, 0, 196))
             painter.drawPath(path)
 
-        font = QFont(painter.font())
-        font.setPointSizeF(Globals.LabelFontSize)
-        metrics = QFontMetrics(font)
+        font, _ = self._get_font_metrics()
         painter.setFont(font)
-        text_bounding_rect = QRectF(metrics.boundingRect(self.m_socket.m_name))
-        text_bounding_rect.setWidth(text_bounding_rect.width() + 6)
+        text_bounding_rect = self._text_bounding_rect(self.m_socket.m_name)
 
-        if self.m_socket.direction() == Socket.Direction.Left:
+        if d == Socket.Direction.Left:
             text_bounding_rect.moveTo(
                 QPointF(
                     rect.left() - text_bounding_rect.width(),
@@ -299,21 +378,21 @@ class SocketItem(QGraphicsItem):
             painter.drawText(
                 text_bounding_rect, Qt.AlignRight | Qt.AlignTop, self.m_socket.m_name
             )
-        elif self.m_socket.direction() == Socket.Direction.Right:
+        elif d == Socket.Direction.Right:
             text_bounding_rect.moveTo(
                 QPointF(rect.right(), rect.top() - text_bounding_rect.height() + 3)
             )
             painter.drawText(
                 text_bounding_rect, Qt.AlignLeft | Qt.AlignTop, self.m_socket.m_name
             )
-        elif self.m_socket.direction() == Socket.Direction.Top:
+        elif d == Socket.Direction.Top:
             painter.translate(rect.left(), rect.top())
             painter.rotate(-90)
             text_bounding_rect.moveTo(0, -text_bounding_rect.height())
             painter.drawText(
                 text_bounding_rect, Qt.AlignLeft | Qt.AlignTop, self.m_socket.m_name
             )
-        elif self.m_socket.direction() == Socket.Direction.Bottom:
+        elif d == Socket.Direction.Bottom:
             painter.translate(rect.left(), rect.bottom())
             painter.rotate(-90)
             text_bounding_rect.moveTo(
@@ -336,8 +415,7 @@ class SocketItem(QGraphicsItem):
             and event.button() == Qt.LeftButton
             and event.modifiers() == Qt.NoModifier
         ):
-            from .scene_manager import SceneManager
-
+            SceneManager = scene_manager_class()
             scene_manager = self.scene()
             if isinstance(scene_manager, SceneManager):
                 pos = event.pos()
@@ -39,12 +39,25 @@ from typing import Optional, Tuple
 from qtpy.QtCore import QPointF, QXmlStreamReader
 
 
+# 布尔属性的取值表，同时接受数值和文本两种写法
+_BOOL_MAP = {
+    "1": True,
+    "true": True,
+    "True": True,
+    "0": False,
+    "false": False,
+    "False": False,
+}
+
+
 class XMLHelpers:
     """提供 XML 文件读取和写入的辅助函数。"""
 
     @staticmethod
     def read_unknown_element(reader: QXmlStreamReader) -> None:
-        """递归读取未知的 XML 元素。
+        """读取（跳过）未知的 XML 元素及其全部子元素。
+
+        使用嵌套深度计数代替递归，任意深度的嵌套都只占用一个栈帧。
 
         Args:
             reader: XML 读取器对象。
@@ -53,12 +66,13 @@ class XMLHelpers:
             return
         assert reader.isStartElement()
 
-        while not reader.atEnd():
+        depth = 1
+        while depth and not reader.atEnd():
             reader.readNext()
-            if reader.isEndElement():
-                break
             if reader.isStartElement():
-                XMLHelpers.read_unknown_element(reader)
+                depth += 1
+            elif reader.isEndElement():
+                depth -= 1
 
     @staticmethod
     def read_until_end_element(reader: QXmlStreamReader) -> None:
@@ -69,12 +83,14 @@ class XMLHelpers:
         """
         if reader.error() != QXmlStreamReader.NoError:
             return
-        while not reader.atEnd():
+
+        depth = 1
+        while depth and not reader.atEnd():
             reader.readNext()
-            if reader.isEndElement():
-                break
             if reader.isStartElement():
-                XMLHelpers.read_unknown_element(reader)
+                depth += 1
+            elif reader.isEndElement():
+                depth -= 1
 
     @staticmethod
     def read_double_attribute(
@@ -150,6 +166,10 @@ class XMLHelpers:
         if reader.error() != QXmlStreamReader.NoError:
             return None
         value_str = str(reader.attributes().value(name))
+        value = _BOOL_MAP.get(value_str)
+        if value is not None:
+            return value
+        # 表外的取值按整数解析，与原有行为一致（如 "2"、"-1" 视为 True）
         try:
             return bool(int(value_str))
         except ValueError:
@@ -35,10 +35,10 @@
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import math
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 
-from PySide2.QtWidgets import QApplication
-from qtpy.QtCore import QPointF, QSize, QLineF, QEvent, Qt
+from qtpy.QtCore import QPointF, QEvent, Qt, QTimer
 from qtpy.QtGui import (
     QPainter,
     QColor,
@@ -46,11 +46,32 @@ from qtpy.QtGui import (
     QWheelEvent,
     QMouseEvent,
     QPaintEvent,
+    QPainterPath,
+    QPixmap,
 )
-from qtpy.QtWidgets import QGraphicsView, QWidget
+from qtpy.QtWidgets import QApplication, QGraphicsScene, QGraphicsView, QWidget
 
 from BlockModPy.scene_manager import SceneManager
 
+# 网格线缓存保留的最近网格数量
+_GRID_CACHE_SIZE = 8
+
+# 中键按下后移动超过该距离（像素，横纵之和）才视为拖拽并切换光标
+_DRAG_CURSOR_THRESHOLD = 3
+
+# 鼠标滚轮一个标准刻度对应的 angleDelta
+_WHEEL_NOTCH = 120
+
+# 缩放后延迟通知分辨率变化的时间，单位：毫秒
+_RESOLUTION_EVENT_DELAY = 50
+
+# 缩放级别的上下限，以及各级别对应的缩放系数 10^(级别/20)
+_MAX_ZOOM_LEVEL = 3000
+_ZOOM_FACTORS = tuple(
+    math.pow(10, z / 20.0) for z in range(-_MAX_ZOOM_LEVEL, _MAX_ZOOM_LEVEL + 1)
+)
+
+
 class ZoomMeshGraphicsView(QGraphicsView):
     """提供网格和缩放功能的 2D 图形视图类。"""
 
@@ -63,22 +84,50 @@ class ZoomMeshGraphicsView(QGraphicsView):
         super().__init__(parent)
         self.m_resolution: float = 1000.0  # 分辨率，单位：像素/米
         self.m_grid_step: float = 0.1  # 网格间距，单位：米
+        # 未缩放时的主网格间距，单位：像素；随分辨率和网格间距的设置函数更新
+        self.m_base_grid_spacing: float = self.m_resolution * self.m_grid_step
         self.m_grid_enabled: bool = True  # 是否启用网格
         self.m_zoom_level: int = 0  # 缩放级别
         self.m_grid_color: QColor = QColor(175, 175, 255)  # 网格颜色
         self.m_pos: QPointF = QPointF()  # 当前鼠标位置
-        self.m_major_grid: List[QLineF] = []  # 主网格线
-        self.m_minor_grid: List[QLineF] = []  # 次网格线
-        self.m_p_last: QPointF = QPointF()  # 上次网格更新的参考点
-        self.m_grid_spacing_pix_last: float = 0.0  # 上次网格更新的网格间距
-        self.m_window_size_last: QSize = QSize()  # 上次网格更新的窗口大小
+        self.m_major_grid: QPainterPath = QPainterPath()  # 主网格线路径
+        self.m_minor_grid: QPainterPath = QPainterPath()  # 次网格线路径
+        # 上次网格更新的键：平铺时为 (间距, 贴图尺寸)，间距超过视口时另含原点
+        self.m_grid_key_last: Optional[tuple] = None
+        # 最近使用过的网格路径缓存：网格键 -> (主网格路径, 次网格路径)
+        self.m_grid_cache: "OrderedDict[tuple, Tuple[QPainterPath, QPainterPath]]" = (
+            OrderedDict()
+        )
+        # 当前网格的光栅化结果，网格键、颜色或设备像素比变化前直接按原点偏移贴图
+        self.m_grid_pixmap: Optional[QPixmap] = None
+        self.m_grids_empty: bool = False  # 主、次网格是否因间距过小而都不可见
+        # 当前场景是否为 SceneManager，在 setScene() 中更新
+        self.m_scene_is_manager: bool = False
+        self.m_debug_axes: bool = False  # 是否绘制经过场景原点的调试参考线
 
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # 只重绘场景中发生变化的区域
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+
+        # 合并同一轮事件循环中多个设置函数触发的重绘请求
+        self.m_update_pending: bool = False
+        self.m_update_timer = QTimer(self)
+        self.m_update_timer.setSingleShot(True)
+        self.m_update_timer.setInterval(0)
+        self.m_update_timer.timeout.connect(self._on_update_timer)
+
+        # 连续缩放结束后才通知一次分辨率变化，避免每个滚轮刻度都调用 change_resolution_event()
+        self.m_resolution_event_timer = QTimer(self)
+        self.m_resolution_event_timer.setSingleShot(True)
+        self.m_resolution_event_timer.setInterval(_RESOLUTION_EVENT_DELAY)
+        self.m_resolution_event_timer.timeout.connect(self.change_resolution_event)
+
+        self.m_wheel_accum: int = 0  # 尚未换算成缩放级别的滚轮滚动量
 
         # 中键拖拽相关成员变量
         self.m_midButtonPressed = False
         self.m_dragStartPos = QPointF()
+        self.m_drag_cursor_set = False  # 是否已切换为拖拽光标
 
     # def zoom_level(self) -> int:
     #     """获取当前缩放级别。
@@ -95,7 +144,8 @@ class ZoomMeshGraphicsView(QGraphicsView):
             color: 网格颜色。
         """
         self.m_grid_color = color
-        self.viewport().update()
+        self.m_grid_pixmap = None
+        self._schedule_update()
 
     def set_grid_enabled(self, enabled: bool) -> None:
         """设置网格是否启用。
@@ -104,21 +154,24 @@ class ZoomMeshGraphicsView(QGraphicsView):
             enabled: 是否启用网格。
         """
         self.m_grid_enabled = enabled
-        self.viewport().update()
+        self._schedule_update()
+
+    def set_debug_axes(self, enabled: bool) -> None:
+        """设置是否绘制经过场景原点的红色调试参考线。
+
+        Args:
+            enabled: 是否绘制调试参考线。
+        """
+        self.m_debug_axes = enabled
+        self._schedule_update()
 
     def zoom_in(self) -> None:
         """放大视图。"""
-        self.m_zoom_level = min(self.m_zoom_level + 1, 3000)
-        factor = math.pow(10, self.m_zoom_level / 20.0)
-        self.setTransform(QTransform(factor, 0, 0, factor, 0, 0))
-        self.change_resolution_event()
+        self._apply_zoom(self.m_zoom_level + 1)
 
     def zoom_out(self) -> None:
         """缩小视图。"""
-        self.m_zoom_level = max(self.m_zoom_level - 1, -3000)
-        factor = math.pow(10, self.m_zoom_level / 20.0)
-        self.setTransform(QTransform(factor, 0, 0, factor, 0, 0))
-        self.change_resolution_event()
+        self._apply_zoom(self.m_zoom_level - 1)
 
     def set_zoom_level(self, zoom_level: int) -> None:
         """设置缩放级别。
@@ -126,10 +179,18 @@ class ZoomMeshGraphicsView(QGraphicsView):
         Args:
             zoom_level: 新的缩放级别。
         """
-        self.m_zoom_level = max(min(zoom_level, 3000), -3000)
-        factor = math.pow(10, self.m_zoom_level / 20.0)
+        self._apply_zoom(zoom_level)
+
+    def _apply_zoom(self, zoom_level: int) -> None:
+        """将缩放级别限制在允许范围内，并按查表得到的缩放系数设置视图变换。
+
+        Args:
+            zoom_level: 新的缩放级别。
+        """
+        self.m_zoom_level = max(min(zoom_level, _MAX_ZOOM_LEVEL), -_MAX_ZOOM_LEVEL)
+        factor = _ZOOM_FACTORS[self.m_zoom_level + _MAX_ZOOM_LEVEL]
         self.setTransform(QTransform(factor, 0, 0, factor, 0, 0))
-        self.change_resolution_event()
+        self.m_resolution_event_timer.start()
 
     def reset_zoom(self) -> None:
         """重置缩放级别。"""
@@ -145,7 +206,9 @@ class ZoomMeshGraphicsView(QGraphicsView):
         if grid_step <= 0:
             return
         self.m_grid_step = grid_step
-        self.viewport().update()
+        self.m_base_grid_spacing = self.m_resolution * grid_step
+        self.invalidate_grid_cache()
+        self._schedule_update()
 
     def set_resolution(self, res: float) -> None:
         """设置分辨率。
@@ -156,8 +219,43 @@ class ZoomMeshGraphicsView(QGraphicsView):
         if res <= 0:
             return
         self.m_resolution = res
+        self.m_base_grid_spacing = res * self.m_grid_step
+        self.invalidate_grid_cache()
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        """请求在本轮事件处理结束后重绘视口，多次请求只重绘一次。
+
+        视图不可见时不做任何事，显示时 Qt 会自行重绘。
+        """
+        if not self.isVisible():
+            return
+        if not self.m_update_pending:
+            self.m_update_pending = True
+            self.m_update_timer.start()
+
+    def _on_update_timer(self) -> None:
+        """合并定时器到期，执行一次视口重绘。"""
+        self.m_update_pending = False
+        # 使用 update() 而非 repaint()：update() 只登记重绘区域，由事件循环合并后统一绘制；
+        # repaint() 会立即同步绘制，交互过程中频繁调用容易引起闪烁和 CPU 峰值
         self.viewport().update()
 
+    def invalidate_grid_cache(self) -> None:
+        """清空网格线缓存，下次绘制时重新生成网格。"""
+        self.m_grid_cache.clear()
+        self.m_grid_key_last = None
+        self.m_grid_pixmap = None
+
+    def setScene(self, scene: Optional[QGraphicsScene]) -> None:
+        """设置视图显示的场景，并记录场景是否为 SceneManager。
+
+        Args:
+            scene: 要显示的场景。
+        """
+        super().setScene(scene)
+        self.m_scene_is_manager = isinstance(scene, SceneManager)
+
     def enterEvent(self, event: QEvent) -> None:
         """处理鼠标进入事件。
 
@@ -167,8 +265,7 @@ class ZoomMeshGraphicsView(QGraphicsView):
         # super().enterEvent(event)
         assert event.type() == QEvent.Enter
 
-        scene_manager = self.scene()
-        if isinstance(scene_manager, SceneManager):
+        if self.m_scene_is_manager:
             while QApplication.overrideCursor() is not None:
                 QApplication.restoreOverrideCursor()
 
@@ -181,8 +278,8 @@ class ZoomMeshGraphicsView(QGraphicsView):
             event: 鼠标事件对象。
         """
         # super().leaveEvent(event)
-        scene_manager = self.scene()
-        if isinstance(scene_manager, SceneManager):
+        if self.m_scene_is_manager:
+            scene_manager = self.scene()
             if scene_manager.is_currently_connecting:
                 scene_manager.finish_connection()
 
@@ -193,7 +290,7 @@ class ZoomMeshGraphicsView(QGraphicsView):
         if event.button() == Qt.MiddleButton:
             self.m_midButtonPressed = True
             self.m_dragStartPos = event.pos()
-            self.setCursor(Qt.ClosedHandCursor)
+            # 光标在实际拖动超过阈值后才切换，单纯的中键点击不改变光标
         else:
             super().mousePressEvent(event)
         event.accept()
@@ -208,11 +305,20 @@ class ZoomMeshGraphicsView(QGraphicsView):
             current_pos = event.pos()
             dx = self.m_dragStartPos.x() - current_pos.x()
             dy = self.m_dragStartPos.y() - current_pos.y()
-            # 使用滚动条直接控制视口移动
-            h_scroll = self.horizontalScrollBar()
-            v_scroll = self.verticalScrollBar()
-            h_scroll.setValue(int(h_scroll.value() + dx))
-            v_scroll.setValue(int(v_scroll.value() + dy))
+            if not self.m_drag_cursor_set:
+                if abs(dx) + abs(dy) <= _DRAG_CURSOR_THRESHOLD:
+                    event.accept()
+                    return
+                self.setCursor(Qt.ClosedHandCursor)
+                self.m_drag_cursor_set = True
+            # 使用滚动条直接控制视口移动，滚动时 Qt 只重绘新露出的区域，这里不再额外请求重绘。
+            # 两次滚动产生的重绘请求由 Qt 合并为一次绘制；位移为零的方向不调用 setValue
+            if dx:
+                h_scroll = self.horizontalScrollBar()
+                h_scroll.setValue(int(h_scroll.value() + dx))
+            if dy:
+                v_scroll = self.verticalScrollBar()
+                v_scroll.setValue(int(v_scroll.value() + dy))
             self.m_dragStartPos = current_pos  # 更新初始位置
         else:
             super().mouseMoveEvent(event)
@@ -221,7 +327,9 @@ class ZoomMeshGraphicsView(QGraphicsView):
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MiddleButton:
             self.m_midButtonPressed = False
-            self.setCursor(Qt.ArrowCursor)
+            if self.m_drag_cursor_set:
+                self.unsetCursor()
+                self.m_drag_cursor_set = False
         else:
             super().mouseReleaseEvent(event)
         event.accept()
@@ -232,10 +340,14 @@ class ZoomMeshGraphicsView(QGraphicsView):
         Args:
             event: 鼠标滚轮事件对象。
         """
-        if event.angleDelta().y() < 0:
-            self.zoom_out()
-        else:
-            self.zoom_in()
+        # 累计滚动量，每满一个标准刻度（120）缩放一级，高精度触控板的细碎事件合并处理
+        self.m_wheel_accum += event.angleDelta().y()
+        steps = int(self.m_wheel_accum / _WHEEL_NOTCH)
+        if steps:
+            self.m_wheel_accum -= steps * _WHEEL_NOTCH
+            self._apply_zoom(self.m_zoom_level + steps)
+            # 缩放后网格整体变化，重绘整个视口
+            self.viewport().update()
         event.accept()
 
     def paintEvent(self, event: QPaintEvent) -> None:
@@ -245,86 +357,171 @@ class ZoomMeshGraphicsView(QGraphicsView):
             event: 绘制事件对象。
         """
 
-        if self.m_grid_enabled:
+        # 视图不可见或尺寸为零时无需生成和绘制网格
+        w = self.width()
+        h = self.height()
+        if self.m_grid_enabled and self.isVisible() and w > 0 and h > 0:
             p = QPainter(self.viewport())
             p1 = self.mapFromScene(QPointF(0, 0))
+            # 原点坐标只取一次，后续比较和生成网格都使用普通浮点数
+            ox = p1.x()
+            oy = p1.y()
 
             # 计算网格间距
-            grid_spacing_pix = self.m_resolution * self.m_grid_step
-            scale_factor = self.transform().m11()
-            grid_spacing_pix *= scale_factor
-
-            h = self.height()
-            w = self.width()
-            window_size = QSize(w, h)
-
-            if (
-                grid_spacing_pix != self.m_grid_spacing_pix_last
-                or p1 != self.m_p_last
-                or window_size != self.m_window_size_last
-            ):
-
-                self.m_p_last = p1
-                self.m_grid_spacing_pix_last = grid_spacing_pix
-                self.m_window_size_last = window_size
-
-                # 主网格
-                self.m_major_grid.clear()
-                if grid_spacing_pix >= 5:
-                    lines_x_till_view = math.floor(-p1.x() / grid_spacing_pix + 1)
-                    offset_x = lines_x_till_view * grid_spacing_pix + p1.x()
-
-                    lines_y_till_view = math.floor(-p1.y() / grid_spacing_pix + 1)
-                    offset_y = lines_y_till_view * grid_spacing_pix + p1.y()
-
-                    for x in [
-                        offset_x + i * grid_spacing_pix
-                        for i in range(int((w - offset_x) / grid_spacing_pix) + 1)
-                    ]:
-                        self.m_major_grid.append(QLineF(x, 0, x, h))
-                    for y in [
-                        offset_y + i * grid_spacing_pix
-                        for i in range(int((h - offset_y) / grid_spacing_pix) + 1)
-                    ]:
-                        self.m_major_grid.append(QLineF(0, y, w, y))
-
-                # 次网格
-                grid_spacing_pix = self.m_resolution * self.m_grid_step * 0.1
-                grid_spacing_pix *= scale_factor
-                self.m_minor_grid.clear()
-                if grid_spacing_pix >= 5:
-                    lines_x_till_view = math.floor(-p1.x() / grid_spacing_pix + 1)
-                    offset_x = lines_x_till_view * grid_spacing_pix + p1.x()
-
-                    lines_y_till_view = math.floor(-p1.y() / grid_spacing_pix + 1)
-                    offset_y = lines_y_till_view * grid_spacing_pix + p1.y()
-
-                    for x in [
-                        offset_x + i * grid_spacing_pix
-                        for i in range(int((w - offset_x) / grid_spacing_pix) + 1)
-                    ]:
-                        self.m_minor_grid.append(QLineF(x, 0, x, h))
-                    for y in [
-                        offset_y + i * grid_spacing_pix
-                        for i in range(int((h - offset_y) / grid_spacing_pix) + 1)
-                    ]:
-                        self.m_minor_grid.append(QLineF(0, y, w, y))
-
-            # 绘制次网格
-            p.setPen(QColor(220, 220, 255))
-            p.drawLines(self.m_minor_grid)
-
-            # 绘制主网格
-            p.setPen(self.m_grid_color)
-            p.drawLines(self.m_major_grid)
+            grid_spacing_pix = self.m_base_grid_spacing * self.transform().m11()
+
+            if grid_spacing_pix < 5:
+                # 次网格间距只有主网格的十分之一，主网格不可见时两者都不可见，无需比较和生成网格
+                if not self.m_grids_empty:
+                    self.m_major_grid = QPainterPath()
+                    self.m_minor_grid = QPainterPath()
+                    self.m_grid_key_last = None
+                    self.m_grid_pixmap = None
+                    self.m_grids_empty = True
+            else:
+                self.m_grids_empty = False
+                if grid_spacing_pix <= min(w, h):
+                    # 网格以主网格间距为周期重复：贴图比视口大一个周期并从周期起点开始生成，
+                    # 平移时只改变贴图的绘制位置，不必重新生成和光栅化网格
+                    tile_ox = 0.0
+                    tile_oy = 0.0
+                    tile_w = w + int(math.ceil(grid_spacing_pix))
+                    tile_h = h + int(math.ceil(grid_spacing_pix))
+                    blit_x = ox % grid_spacing_pix - grid_spacing_pix
+                    blit_y = oy % grid_spacing_pix - grid_spacing_pix
+                    key = (round(grid_spacing_pix, 4), tile_w, tile_h)
+                else:
+                    # 间距超过视口尺寸时平铺贴图会过大，改为按原点生成与视口等大的贴图
+                    tile_ox = ox
+                    tile_oy = oy
+                    tile_w = w
+                    tile_h = h
+                    blit_x = 0.0
+                    blit_y = 0.0
+                    key = (round(grid_spacing_pix, 4), w, h, round(ox, 1), round(oy, 1))
+                if key != self.m_grid_key_last:
+                    self.m_grid_key_last = key
+                    cached = self.m_grid_cache.get(key)
+                    if cached is not None:
+                        self.m_grid_cache.move_to_end(key)
+                    else:
+                        # 主网格
+                        major_grid = self._build_grid_path(
+                            grid_spacing_pix, tile_ox, tile_oy, tile_w, tile_h
+                        )
+
+                        # 次网格，与主网格重合的每第 10 条线由主网格绘制
+                        minor_grid = self._build_grid_path(
+                            grid_spacing_pix * 0.1, tile_ox, tile_oy, tile_w, tile_h, 10
+                        )
+
+                        cached = (major_grid, minor_grid)
+                        self.m_grid_cache[key] = cached
+                        if len(self.m_grid_cache) > _GRID_CACHE_SIZE:
+                            self.m_grid_cache.popitem(last=False)
+                    self.m_major_grid, self.m_minor_grid = cached
+                    self.m_grid_pixmap = None
+
+                dpr = self.viewport().devicePixelRatioF()
+                pixmap = self.m_grid_pixmap
+                if pixmap is None or pixmap.devicePixelRatioF() != dpr:
+                    pixmap = self.m_grid_pixmap = self._render_grid_pixmap(
+                        tile_w, tile_h, dpr
+                    )
+                # 重绘区域之外的部分由 Qt 按绘制事件的区域裁剪
+                p.drawPixmap(QPointF(blit_x, blit_y), pixmap)
 
             # 绘制参考线用于调试
-            p.setPen(QColor(255, 0, 0))
-            p.drawLine(p1.x() - 5000, p1.y(), p1.x() + 5000, p1.y())  # 水平线
-            p.drawLine(p1.x(), p1.y() - 5000, p1.x(), p1.y() + 5000)  # 垂直线
+            if self.m_debug_axes:
+                p.setPen(QColor(255, 0, 0))
+                p.drawLine(ox - 5000, oy, ox + 5000, oy)  # 水平线
+                p.drawLine(ox, oy - 5000, ox, oy + 5000)  # 垂直线
 
         super().paintEvent(event)
 
+    def _render_grid_pixmap(self, w: int, h: int, dpr: float) -> QPixmap:
+        """将当前的主、次网格路径光栅化到透明贴图中。
+
+        Args:
+            w: 贴图宽度。
+            h: 贴图高度。
+            dpr: 视口的设备像素比。
+
+        Returns:
+            指定尺寸的网格贴图。
+        """
+        pixmap = QPixmap(int(math.ceil(w * dpr)), int(math.ceil(h * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        # 网格线都是水平或竖直的 1 像素线，抗锯齿只会增加开销
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        # 绘制次网格
+        painter.setPen(QColor(220, 220, 255))
+        painter.drawPath(self.m_minor_grid)
+
+        # 绘制主网格
+        painter.setPen(self.m_grid_color)
+        painter.drawPath(self.m_major_grid)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def _build_grid_path(
+        grid_spacing_pix: float,
+        ox: float,
+        oy: float,
+        w: int,
+        h: int,
+        skip_every: int = 0,
+    ) -> QPainterPath:
+        """生成覆盖给定区域的一组网格线路径。
+
+        Args:
+            grid_spacing_pix: 网格间距，单位：像素。
+            ox: 场景原点在路径坐标系中的 x 坐标。
+            oy: 场景原点在路径坐标系中的 y 坐标。
+            w: 路径覆盖区域的宽度。
+            h: 路径覆盖区域的高度。
+            skip_every: 大于 0 时跳过序号为其整数倍的网格线（与主网格线重合的次网格线）。
+
+        Returns:
+            包含全部竖直和水平网格线的路径；间距小于 5 像素时不绘制，返回空路径。
+        """
+        path = QPainterPath()
+        if grid_spacing_pix < 5:
+            return path
+
+        # 第一条可见网格线相对场景原点的序号
+        first_x = math.floor(-ox / grid_spacing_pix + 1)
+        first_y = math.floor(-oy / grid_spacing_pix + 1)
+        offset_x = first_x * grid_spacing_pix + ox
+        offset_y = first_y * grid_spacing_pix + oy
+        count_x = int((w - offset_x) / grid_spacing_pix) + 1
+        count_y = int((h - offset_y) / grid_spacing_pix) + 1
+
+        # 坐标直接由下标算出并交给路径，不生成中间列表或 QLineF 对象；
+        # 绑定方法提前取出，避免循环中重复的属性查找
+        move_to = path.moveTo
+        line_to = path.lineTo
+        for i in range(count_x):
+            if skip_every and (first_x + i) % skip_every == 0:
+                continue
+            x = offset_x + i * grid_spacing_pix
+            move_to(x, 0)
+            line_to(x, h)
+        for i in range(count_y):
+            if skip_every and (first_y + i) % skip_every == 0:
+                continue
+            y = offset_y + i * grid_spacing_pix
+            move_to(0, y)
+            line_to(w, y)
+        return path
+
     def change_resolution_event(self) -> None:
-        """处理分辨率变化事件。"""
+        """处理分辨率变化事件。
+
+        缩放后延迟调用，连续缩放期间的多次变化只触发一次，子类可重写以更新与缩放相关的内容。
+        """
         pass
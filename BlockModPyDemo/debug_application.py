@@ -56,6 +56,12 @@ class DebugApplication(QApplication):
 
     """
 
+    # 高频事件类型直接交给基类处理，不进入 try-except 包装；
+    # 这些事件处理函数中的 Python 异常仍会由 Qt 绑定层打印
+    _SAFE_EVENT_TYPES = frozenset(
+        {QEvent.Paint, QEvent.MouseMove, QEvent.Timer, QEvent.UpdateRequest}
+    )
+
     def __init__(self, argv: list) -> None:
         """初始化调试应用程序。
 
@@ -80,6 +86,8 @@ class DebugApplication(QApplication):
         Raises:
             不会主动抛出异常，但会捕获并打印所有异常信息。
         """
+        if event.type() in self._SAFE_EVENT_TYPES:
+            return super().notify(receiver, event)
         try:
             return super().notify(receiver, event)
         except Exception as e:
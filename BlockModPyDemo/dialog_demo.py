@@ -35,24 +35,36 @@
 #  OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import random
-from typing import Optional
+import string
+from typing import List, Optional
 
 from qtpy.QtCore import Qt, QSizeF, QPointF
 from qtpy.QtWidgets import QDialog, QFileDialog, QMessageBox
 
 from BlockModPy.block import Block
+from BlockModPy.connector import Connector
 from BlockModPy.globals import Globals
 from BlockModPy.network import Network
 from BlockModPy.scene_manager import SceneManager
 from BlockModPy.socket import Socket
 from ui.dialog import Ui_BlockModPyDemoDialog  # 导入自动生成的UI类
 
+# 演示对话框的窗口标志：独立窗口，带最小化/最大化和关闭按钮
+_DIALOG_FLAGS = Qt.Window | Qt.WindowMinMaxButtonsHint | Qt.WindowCloseButtonHint
+
+# 随机名称使用的字符
+_LOWER = string.ascii_lowercase
+
+# 随机块在每个候选位置生成插槽的概率
+_SOCKET_PROBABILITY = 1 / 6
+
 
 class DialogDemo(QDialog, Ui_BlockModPyDemoDialog):
     """主演示对话框，提供完整的BlockMod网络编辑功能。
 
     Attributes:
         m_sceneManager (SceneManager): 场景管理对象，负责维护网络模型和视图交互
+        m_rng (random.Random): 生成随机块使用的随机数生成器
     """
 
     def __init__(self, parent: Optional[QDialog] = None) -> None:
@@ -61,11 +73,9 @@ class DialogDemo(QDialog, Ui_BlockModPyDemoDialog):
         Args:
             parent: 父级窗口，默认为None
         """
-        # 设置随机种子以确保测试可重复
-        random.seed(0)
-        super().__init__(
-            parent, Qt.Window | Qt.WindowMinMaxButtonsHint | Qt.WindowCloseButtonHint
-        )
+        super().__init__(parent, _DIALOG_FLAGS)
+        # 使用固定种子的独立随机数生成器，确保测试可重复
+        self.m_rng = random.Random(0)
         self.setupUi(self)  # 初始化自动生成的UI
 
         # 初始化场景管理器
@@ -121,9 +131,7 @@ class DialogDemo(QDialog, Ui_BlockModPyDemoDialog):
 
     def on_pushButtonRemoveBlock_clicked(self) -> None:
         """处理移除块按钮点击事件，删除选中块。"""
-        selected_blocks = self.m_sceneManager.selected_blocks()
-        for block in selected_blocks:
-            self.m_sceneManager.remove_block(block)
+        self.m_sceneManager.remove_blocks(self.m_sceneManager.selected_blocks())
 
     def on_pushButtonRemoveConnection_clicked(self) -> None:
         """处理移除连接按钮点击事件，删除选中连接线。"""
@@ -150,20 +158,33 @@ class DialogDemo(QDialog, Ui_BlockModPyDemoDialog):
             network.read_xml(filename)
             network.check_names()
 
-            # 验证并调整连接器
-            valid_connectors = []
-            for con in network.m_connectors:
-                try:
-                    network.adjust_connector(con)
-                    valid_connectors.append(con)
-                except Exception:
-                    continue
-            network.m_connectors = valid_connectors
+            # 验证并调整连接器，丢弃无法调整的连接器
+            network.m_connectors = [
+                con
+                for con in network.m_connectors
+                if self._try_adjust_connector(network, con)
+            ]
             self.m_sceneManager.set_network(network)
         except Exception as e:
             QMessageBox.critical(self, "加载失败", f"无法加载网络文件：{str(e)}")
             raise RuntimeError(f"网络加载失败: {str(e)}") from e
 
+    @staticmethod
+    def _try_adjust_connector(network: Network, con: Connector) -> bool:
+        """尝试调整连接器的几何信息。
+
+        Args:
+            network: 连接器所属的网络
+            con: 要调整的连接器
+
+        Returns:
+            调整成功返回True，连接器无效时返回False
+        """
+        if not network.can_adjust_connector(con):
+            return False
+        network.adjust_connector(con)
+        return True
+
     def _generate_random_block(self) -> Block:
         """生成随机几何属性和插槽配置的块。
 
@@ -171,52 +192,56 @@ class DialogDemo(QDialog, Ui_BlockModPyDemoDialog):
             生成的Block对象，包含随机名称、尺寸和插槽配置
         """
         block = Block()
+        gs = Globals.GridSpacing
+        rng = self.m_rng
+        rand = rng.random
+        randint = rng.randint
 
         # 生成随机名称（4-8个字母）
-        name_length = 4 + random.randint(0, 4)
-        block.m_name = "".join(
-            [chr(97 + random.randint(0, 25)) for _ in range(name_length)]
-        )
+        name_length = 4 + randint(0, 4)
+        block.m_name = "".join(rng.choices(_LOWER, k=name_length))
 
         # 生成随机尺寸（基于网格间距）
-        grid_x = name_length + 4 + random.randint(0, 8)
-        grid_y = 3 + random.randint(0, 8)
-        block.m_size = QSizeF(
-            grid_x * Globals.GridSpacing, grid_y * Globals.GridSpacing
-        )
+        grid_x = name_length + 4 + randint(0, 8)
+        grid_y = 3 + randint(0, 8)
+        block.m_size = QSizeF(grid_x * gs, grid_y * gs)
 
         # 随机位置（0-30格）
         block.m_pos = QPointF(
-            int(random.uniform(0, 30)) * Globals.GridSpacing,
-            int(random.uniform(0, 30)) * Globals.GridSpacing,
+            int(rng.uniform(0, 30)) * gs,
+            int(rng.uniform(0, 30)) * gs,
         )
 
-        # 生成随机插槽
+        # 生成随机插槽，先收集到局部列表，最后一次性设置到块
+        sockets: List[Socket] = []
         for i in range(0, grid_x - 2, 2):
             # 顶部边缘插槽
-            if random.random() < 1 / 6:
-                self._add_random_socket(block, i, True)
+            if rand() < _SOCKET_PROBABILITY:
+                self._add_random_socket(block, sockets, i, True)
             # 底部边缘插槽
-            if random.random() < 1 / 6:
-                self._add_random_socket(block, i, False)
+            if rand() < _SOCKET_PROBABILITY:
+                self._add_random_socket(block, sockets, i, False)
+        block.set_sockets(sockets)
 
         return block
 
-    def _add_random_socket(self, block: Block, index: int, is_top: bool) -> None:
-        """为块添加随机配置的插槽。
+    def _add_random_socket(
+        self, block: Block, sockets: List[Socket], index: int, is_top: bool
+    ) -> None:
+        """生成一个随机配置的插槽并追加到插槽列表。
 
         Args:
-            block: 目标块对象
+            block: 目标块对象，用于确定插槽位置
+            sockets: 接收新插槽的列表
             index: X轴网格索引
             is_top: 是否位于顶部边缘
         """
         socket = Socket()
-        socket.m_inlet = random.random() < 0.5
-        name_length = random.randint(1, 6)
-        socket.m_name = "".join(
-            [chr(97 + random.randint(0, 25)) for _ in range(name_length)]
-        )
+        rng = self.m_rng
+        socket.m_inlet = rng.random() < 0.5
+        name_length = rng.randint(1, 6)
+        socket.m_name = "".join(rng.choices(_LOWER, k=name_length))
         socket.m_orientation = Qt.Vertical
         y_pos = 0.0 if is_top else block.m_size.height()
         socket.m_pos = QPointF((index + 1) * Globals.GridSpacing, y_pos)
-        block.m_sockets.append(socket)
+        sockets.append(socket)
@@ -37,11 +37,36 @@
 import locale
 import sys
 import traceback
+from functools import lru_cache
+from typing import Optional
 
-from qtpy.QtCore import QMessageLogContext, QtMsgType, qInstallMessageHandler
+from qtpy.QtCore import QMessageLogContext, Qt, QtMsgType, qInstallMessageHandler
 
 from BlockModPyDemo.debug_application import DebugApplication
-from BlockModPyDemo.dialog_demo import DialogDemo
+
+# 各平台的默认字体字号（macOS / Linux / Windows）
+_FONT_POINT_SIZES = {"darwin": 10, "linux": 9, "win32": 8}
+
+# 不使用桌面环境字体和调色板设置的平台
+_DESKTOP_SETTINGS_UNAWARE = frozenset({"darwin", "linux"})
+
+
+@lru_cache(maxsize=1024)
+def _decode_function_name(function: Optional[bytes]) -> str:
+    """解码消息上下文中的C++函数名并去除装饰符号，同一来源的消息只解码一次。
+
+    Args:
+        function: 消息上下文中的函数名原始字节
+
+    Returns:
+        函数名，无函数信息时返回"unknown"
+    """
+    if not function:
+        return "unknown"
+    name = function.decode("utf-8")
+    if name.startswith('"'):
+        name = name[1:-1]
+    return name
 
 
 def q_debug_msg_handler(
@@ -54,11 +79,7 @@ def q_debug_msg_handler(
         context: 消息上下文信息
         msg: 消息内容
     """
-    # 提取C++函数名（去除装饰符号）
-    function = context.function.decode("utf-8") if context.function else "unknown"
-    if function.startswith('"'):
-        function = function[1:-1]
-    print(f"[{function}] {msg}")
+    sys.stdout.write(f"[{_decode_function_name(context.function)}] {msg}\n")
 
 
 def main() -> int:
@@ -73,33 +94,34 @@ def main() -> int:
     # 安装消息处理器
     qInstallMessageHandler(q_debug_msg_handler)
 
-    # 区域设置配置
-    if sys.platform.startswith("linux") or sys.platform.startswith("darwin"):
-        locale.setlocale(locale.LC_NUMERIC, "C")
+    # 区域设置配置；不带参数的 setlocale() 只查询当前设置，已是 "C" 时无需重新加载
+    if sys.platform.startswith(("linux", "darwin")):
+        if locale.setlocale(locale.LC_NUMERIC) not in ("C", "POSIX"):
+            locale.setlocale(locale.LC_NUMERIC, "C")
 
     # 字体配置
+    platform = "linux" if sys.platform.startswith("linux") else sys.platform
     font = app.font()
-    if sys.platform == "darwin":  # macOS
-        font.setPointSize(10)
+    point_size = _FONT_POINT_SIZES.get(platform)
+    if point_size is not None:
+        font.setPointSize(point_size)
+    if platform in _DESKTOP_SETTINGS_UNAWARE:
         app.setDesktopSettingsAware(False)
-    elif sys.platform.startswith("linux"):  # Linux/Unix
-        font.setPointSize(9)
-        app.setDesktopSettingsAware(False)
-    elif sys.platform == "win32":  # Windows
-        font.setPointSize(8)
     app.setFont(font)
 
     # 主事件循环
     exit_code = 0
     try:
-        # 创建并显示主对话框
+        # 创建并显示主对话框；对话框模块依赖场景、网络和界面模块，
+        # 在应用程序初始化完成后再导入，缩短启动前的导入时间
+        from BlockModPyDemo.dialog_demo import DialogDemo
+
         main_dialog = DialogDemo()
 
-        # 窗口显示策略
+        # 窗口显示策略：Windows 下在显示前设置最大化状态，窗口直接以最终尺寸显示并只布局一次
         if sys.platform == "win32":
-            main_dialog.showMaximized()
-        else:
-            main_dialog.show()
+            main_dialog.setWindowState(main_dialog.windowState() | Qt.WindowMaximized)
+        main_dialog.show()
 
         # 运行事件循环
         exit_code = app.exec_()
@@ -8,13 +8,37 @@
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
 
-from qtpy.QtCore import *
-from qtpy.QtGui import *
-from qtpy.QtWidgets import *
+from functools import lru_cache
+
+from qtpy.QtCore import QCoreApplication, QMetaObject, QSize
+from qtpy.QtGui import QIcon
+from qtpy.QtWidgets import (
+    QCheckBox,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QToolButton,
+    QVBoxLayout,
+    QWidget,
+)
 
 from BlockModPy.zoom_mesh_graphics_view import ZoomMeshGraphicsView
 from BlockModPyDemo.resources import BlockModDemoPy_rc  # noqa
 
+_ICON_SIZE_32 = QSize(32, 32)
+_ICON_SIZE_24 = QSize(24, 24)
+
+
+@lru_cache(maxsize=None)
+def _icon(path):
+    # QIcon 隐式共享，同一资源图标只加载一次，多个对话框共用
+    icon = QIcon()
+    icon.addFile(path, QSize(), QIcon.Normal, QIcon.Off)
+    return icon
+
 
 class Ui_BlockModPyDemoDialog(object):
     def setupUi(self, BlockModPyDemoDialog):
@@ -29,28 +53,22 @@ class Ui_BlockModPyDemoDialog(object):
         self.horizontalLayout.setObjectName("horizontalLayout")
         self.toolButtonNew = QToolButton(self.widget_2)
         self.toolButtonNew.setObjectName("toolButtonNew")
-        icon = QIcon()
-        icon.addFile(":/gfx/filenew_32x32.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonNew.setIcon(icon)
-        self.toolButtonNew.setIconSize(QSize(32, 32))
+        self.toolButtonNew.setIcon(_icon(":/gfx/filenew_32x32.png"))
+        self.toolButtonNew.setIconSize(_ICON_SIZE_32)
 
         self.horizontalLayout.addWidget(self.toolButtonNew)
 
         self.toolButtonOpen = QToolButton(self.widget_2)
         self.toolButtonOpen.setObjectName("toolButtonOpen")
-        icon1 = QIcon()
-        icon1.addFile(":/gfx/fileopen_32x32.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonOpen.setIcon(icon1)
-        self.toolButtonOpen.setIconSize(QSize(32, 32))
+        self.toolButtonOpen.setIcon(_icon(":/gfx/fileopen_32x32.png"))
+        self.toolButtonOpen.setIconSize(_ICON_SIZE_32)
 
         self.horizontalLayout.addWidget(self.toolButtonOpen)
 
         self.toolButtonSave = QToolButton(self.widget_2)
         self.toolButtonSave.setObjectName("toolButtonSave")
-        icon2 = QIcon()
-        icon2.addFile(":/gfx/filesave_32x32.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonSave.setIcon(icon2)
-        self.toolButtonSave.setIconSize(QSize(32, 32))
+        self.toolButtonSave.setIcon(_icon(":/gfx/filesave_32x32.png"))
+        self.toolButtonSave.setIconSize(_ICON_SIZE_32)
 
         self.horizontalLayout.addWidget(self.toolButtonSave)
 
@@ -62,10 +80,8 @@ class Ui_BlockModPyDemoDialog(object):
 
         self.toolButtonInfo = QToolButton(self.widget_2)
         self.toolButtonInfo.setObjectName("toolButtonInfo")
-        icon3 = QIcon()
-        icon3.addFile(":/gfx/info_32x32.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonInfo.setIcon(icon3)
-        self.toolButtonInfo.setIconSize(QSize(32, 32))
+        self.toolButtonInfo.setIcon(_icon(":/gfx/info_32x32.png"))
+        self.toolButtonInfo.setIconSize(_ICON_SIZE_32)
 
         self.horizontalLayout.addWidget(self.toolButtonInfo)
 
@@ -125,19 +141,15 @@ class Ui_BlockModPyDemoDialog(object):
 
         self.toolButtonAddSocket = QToolButton(self.groupBox_2)
         self.toolButtonAddSocket.setObjectName("toolButtonAddSocket")
-        icon4 = QIcon()
-        icon4.addFile(":/gfx/plus.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonAddSocket.setIcon(icon4)
-        self.toolButtonAddSocket.setIconSize(QSize(24, 24))
+        self.toolButtonAddSocket.setIcon(_icon(":/gfx/plus.png"))
+        self.toolButtonAddSocket.setIconSize(_ICON_SIZE_24)
 
         self.gridLayout.addWidget(self.toolButtonAddSocket, 0, 1, 1, 1)
 
         self.toolButtonRemoveSocket = QToolButton(self.groupBox_2)
         self.toolButtonRemoveSocket.setObjectName("toolButtonRemoveSocket")
-        icon5 = QIcon()
-        icon5.addFile(":/gfx/minus.png", QSize(), QIcon.Normal, QIcon.Off)
-        self.toolButtonRemoveSocket.setIcon(icon5)
-        self.toolButtonRemoveSocket.setIconSize(QSize(24, 24))
+        self.toolButtonRemoveSocket.setIcon(_icon(":/gfx/minus.png"))
+        self.toolButtonRemoveSocket.setIconSize(_ICON_SIZE_24)
 
         self.gridLayout.addWidget(self.toolButtonRemoveSocket, 1, 1, 1, 1)
 